@@ -5,17 +5,36 @@ Part of MailMaestro-level intelligence layer
 """
 
 import json
+import logging
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from openai import OpenAI
+from llm_client import get_openai_client
 from config import config
 
+logger = logging.getLogger(__name__)
+
+# Fixed patterns compiled once at import rather than re-parsed per call
+TITLE_PREFIX_RE = re.compile(r"^(re:|fwd:|meeting:?|call:?|zoom:?)\s*", re.IGNORECASE)
+DURATION_RES = [
+    re.compile(r"(\d+)\s*(?:hour|hr|h)", re.IGNORECASE),
+    re.compile(r"(\d+)\s*(?:minute|min|m)", re.IGNORECASE),
+    re.compile(r"(\d+):(\d+)\s*(?:to|until|-)\s*(\d+):(\d+)", re.IGNORECASE)
+]
+LOCATION_RES = [
+    re.compile(r"(?:location|where|room|address):\s*(.{5,50})", re.IGNORECASE),
+    re.compile(r"(?:at|in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:room|building|office)", re.IGNORECASE),
+    re.compile(r"room\s+(\w+)", re.IGNORECASE),
+    re.compile(r"(\d+\s+[A-Za-z\s]+(?:street|st|avenue|ave|road|rd))", re.IGNORECASE)
+]
+EMAIL_ADDRESS_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+CLOCK_TIME_RE = re.compile(r"(\d{1,2}):?(\d{0,2})\s*(am|pm|AM|PM)?")
+SECTION_SPLIT_RE = re.compile(r'\n\s*\n')
+
 class CalendarExtractor:
     """Extract meeting details and propose calendar responses"""
     
     def __init__(self, model_router=None):
-        self.client = OpenAI()
         self.model_router = model_router
         
         # Meeting indicators
@@ -25,32 +44,43 @@ class CalendarExtractor:
             "sync", "standup", "review", "discussion"
         ]
         
-        # Time patterns
+        # Time patterns (compiled once; all matched case-insensitively)
         self.time_patterns = [
-            r"(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)",
-            r"(\d{1,2})\s*(am|pm|AM|PM)",
-            r"(\d{1,2}):(\d{2})",
-            r"(\d{1,2})\s*(?:o'clock|oclock)"
+            re.compile(pattern, re.IGNORECASE) for pattern in [
+                r"(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)",
+                r"(\d{1,2})\s*(am|pm|AM|PM)",
+                r"(\d{1,2}):(\d{2})",
+                r"(\d{1,2})\s*(?:o'clock|oclock)"
+            ]
         ]
         
         # Date patterns
         self.date_patterns = [
-            r"(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
-            r"(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}",
-            r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{1,2}",
-            r"\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?",
-            r"(?:today|tomorrow|next\s+\w+day)"
+            re.compile(pattern, re.IGNORECASE) for pattern in [
+                r"(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
+                r"(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}",
+                r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{1,2}",
+                r"\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?",
+                r"(?:today|tomorrow|next\s+\w+day)"
+            ]
         ]
         
         # Platform patterns
         self.platform_patterns = {
-            "zoom": r"zoom\.us/[j/]+(\d+)",
-            "teams": r"teams\.microsoft\.com",
-            "meet": r"meet\.google\.com/[a-z-]+",
-            "webex": r"webex\.com",
-            "gotomeeting": r"gotomeeting\.com"
+            platform: re.compile(pattern, re.IGNORECASE) for platform, pattern in {
+                "zoom": r"zoom\.us/[j/]+(\d+)",
+                "teams": r"teams\.microsoft\.com",
+                "meet": r"meet\.google\.com/[a-z-]+",
+                "webex": r"webex\.com",
+                "gotomeeting": r"gotomeeting\.com"
+            }.items()
         }
     
+    @property
+    def client(self):
+        """Shared OpenAI client, looked up on use rather than pinned at construction"""
+        return get_openai_client()
+    
     def extract_meeting_info(self, email_text: str, email_metadata: Dict = None) -> Optional[Dict]:
         """
         Extract meeting information from email content
@@ -90,7 +120,7 @@ class CalendarExtractor:
             return None
             
         except Exception as e:
-            print(f"Error extracting meeting info: {e}")
+            logger.warning("Error extracting meeting info: %s", e)
             return None
     
     def propose_calendar_response(self, meeting_info: Dict, user_context: Dict = None) -> Dict:
@@ -131,7 +161,7 @@ class CalendarExtractor:
             }
             
         except Exception as e:
-            print(f"Error proposing response: {e}")
+            logger.warning("Error proposing response: %s", e)
             return {"action": "none", "message": "", "confidence": 0.0}
     
     def _has_meeting_indicators(self, email_text: str) -> bool:
@@ -142,8 +172,8 @@ class CalendarExtractor:
         keyword_count = sum(1 for keyword in self.meeting_keywords if keyword in text_lower)
         
         # Check for time/date patterns
-        has_time = any(re.search(pattern, email_text, re.IGNORECASE) for pattern in self.time_patterns)
-        has_date = any(re.search(pattern, email_text, re.IGNORECASE) for pattern in self.date_patterns)
+        has_time = any(pattern.search(email_text) for pattern in self.time_patterns)
+        has_date = any(pattern.search(email_text) for pattern in self.date_patterns)
         
         return keyword_count >= 1 and (has_time or has_date)
     
@@ -152,7 +182,7 @@ class CalendarExtractor:
         if email_metadata and email_metadata.get("subject"):
             subject = email_metadata["subject"]
             # Clean common meeting prefixes
-            title = re.sub(r"^(re:|fwd:|meeting:?|call:?|zoom:?)\s*", "", subject, flags=re.IGNORECASE)
+            title = TITLE_PREFIX_RE.sub("", subject)
             return title.strip()
         
         # Try to extract from first line
@@ -170,7 +200,7 @@ class CalendarExtractor:
         for line in text_lines:
             # Look for time patterns
             for pattern in self.time_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+                match = pattern.search(line)
                 if match:
                     # Try to find associated date
                     date_str = self._find_date_near_time(line, email_text)
@@ -188,14 +218,8 @@ class CalendarExtractor:
     def _extract_end_time(self, email_text: str) -> Optional[str]:
         """Extract meeting end time"""
         # Look for duration or end time
-        duration_patterns = [
-            r"(\d+)\s*(?:hour|hr|h)",
-            r"(\d+)\s*(?:minute|min|m)",
-            r"(\d+):(\d+)\s*(?:to|until|-)\s*(\d+):(\d+)"
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, email_text, re.IGNORECASE)
+        for pattern in DURATION_RES:
+            match = pattern.search(email_text)
             if match:
                 # For now, assume 1 hour if not specified
                 start_time = self._extract_start_time(email_text)
@@ -217,15 +241,8 @@ class CalendarExtractor:
             return platform
         
         # Look for location patterns
-        location_patterns = [
-            r"(?:location|where|room|address):\s*(.{5,50})",
-            r"(?:at|in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:room|building|office)",
-            r"room\s+(\w+)",
-            r"(\d+\s+[A-Za-z\s]+(?:street|st|avenue|ave|road|rd))"
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, email_text, re.IGNORECASE)
+        for pattern in LOCATION_RES:
+            match = pattern.search(email_text)
             if match:
                 return match.group(1).strip()
         
@@ -234,7 +251,7 @@ class CalendarExtractor:
     def _extract_platform(self, email_text: str) -> str:
         """Extract meeting platform"""
         for platform, pattern in self.platform_patterns.items():
-            if re.search(pattern, email_text, re.IGNORECASE):
+            if pattern.search(email_text):
                 return platform.title()
         
         # Check for generic virtual meeting indicators
@@ -255,8 +272,7 @@ class CalendarExtractor:
                 attendees.append(sender)
         
         # Look for email addresses in text
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        emails = re.findall(email_pattern, email_text)
+        emails = EMAIL_ADDRESS_RE.findall(email_text)
         attendees.extend(emails)
         
         return list(set(attendees))  # Remove duplicates
@@ -288,7 +304,7 @@ class CalendarExtractor:
         """Find date associated with time mention"""
         # First check the same line
         for pattern in self.date_patterns:
-            match = re.search(pattern, time_line, re.IGNORECASE)
+            match = pattern.search(time_line)
             if match:
                 return match.group(0)
         
@@ -299,7 +315,7 @@ class CalendarExtractor:
                 # Check previous and next lines
                 for j in range(max(0, i-2), min(len(lines), i+3)):
                     for pattern in self.date_patterns:
-                        match = re.search(pattern, lines[j], re.IGNORECASE)
+                        match = pattern.search(lines[j])
                         if match:
                             return match.group(0)
         
@@ -326,7 +342,7 @@ class CalendarExtractor:
                 target_date = today.date()  # Default to today
             
             # Parse time
-            time_match = re.search(r"(\d{1,2}):?(\d{0,2})\s*(am|pm|AM|PM)?", time_str)
+            time_match = CLOCK_TIME_RE.search(time_str)
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2)) if time_match.group(2) else 0
@@ -376,7 +392,7 @@ class CalendarExtractor:
         meetings = []
         
         # Split email into sections and check each
-        sections = re.split(r'\n\s*\n', email_text)
+        sections = SECTION_SPLIT_RE.split(email_text)
         
         for section in sections:
             if len(section.strip()) > 50:  # Skip very short sections
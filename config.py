@@ -39,6 +39,7 @@ class SecureConfig:
 
         # Circuit breaker settings
         self.OPENAI_TIMEOUT_SECONDS = float(os.getenv('OPENAI_TIMEOUT_SECONDS', '5.0'))
+        self.OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '1'))  # SDK retries 408/429/5xx only, with jittered backoff
         self.OPENAI_MAX_LATENCY_MS = int(os.getenv('OPENAI_MAX_LATENCY_MS', '800'))
         self.CIRCUIT_BREAKER_WINDOW = int(os.getenv('CIRCUIT_BREAKER_WINDOW', '10'))  # Number of calls to track
 
@@ -50,6 +51,10 @@ class SecureConfig:
         self.FAST_PATH_TARGET_MS = int(os.getenv('FAST_PATH_TARGET_MS', '100'))
         self.SMART_PATH_TARGET_MS = int(os.getenv('SMART_PATH_TARGET_MS', '900'))
 
+        # Semantic reply cache (reuse a smart reply for a near-identical email)
+        self.SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.92'))
+        self.SEMANTIC_CACHE_TTL_SECONDS = float(os.getenv('SEMANTIC_CACHE_TTL_SECONDS', '3600'))
+
     def _get_or_create_encryption_key(self):
         """Get encryption key from secure storage or create new one"""
         try:
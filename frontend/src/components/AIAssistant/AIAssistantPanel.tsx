@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import {
   Box,
   Paper,
@@ -22,15 +22,18 @@ interface TabPanelProps {
   children?: React.ReactNode;
   index: number;
   value: number;
+  keepMounted?: boolean;
 }
 
-const TabPanel: React.FC<TabPanelProps> = ({ children, value, index }) => (
+// keepMounted panels stay in the tree while hidden, so switching back to them
+// shows their existing results instead of refetching
+const TabPanel: React.FC<TabPanelProps> = ({ children, value, index, keepMounted = false }) => (
   <div
     role="tabpanel"
     hidden={value !== index}
     style={{ height: value === index ? 'calc(100% - 64px)' : 0 }}
   >
-    {value === index && (
+    {(value === index || keepMounted) && (
       <Box sx={{ height: '100%', overflow: 'auto' }}>
         {children}
       </Box>
@@ -48,6 +51,12 @@ const AIAssistantPanel: React.FC<AIAssistantPanelProps> = ({
   threadId,
 }) => {
   const [selectedTab, setSelectedTab] = useState(0);
+  // Tabs opened for the current email; a different email starts from scratch
+  const [visited, setVisited] = useState<{ emailId: string; tabs: number[] }>({
+    emailId,
+    tabs: [0],
+  });
+  const visitedTabs = visited.emailId === emailId ? visited.tabs : [0];
 
   // Auto-switch to relevant tabs based on content
   useEffect(() => {
@@ -55,11 +64,28 @@ const AIAssistantPanel: React.FC<AIAssistantPanelProps> = ({
     setSelectedTab(0);
   }, [emailId]);
 
-  const handleTabChange = (event: React.SyntheticEvent, newValue: number) => {
+  const handleTabChange = useCallback((event: React.SyntheticEvent, newValue: number) => {
     setSelectedTab(newValue);
-  };
+    setVisited(prev => {
+      const tabs = prev.emailId === emailId ? prev.tabs : [0];
+      return tabs.indexOf(newValue) === -1
+        ? { emailId, tabs: [...tabs, newValue] }
+        : { emailId, tabs };
+    });
+  }, [emailId]);
+
+  // Stable callbacks so SummaryTab's effect doesn't re-run on every render
+  const handleTasksFound = useCallback(() => {
+    // Auto-switch to tasks tab if tasks are found
+    // Could implement notification here
+  }, []);
+
+  const handleMeetingFound = useCallback(() => {
+    // Auto-switch to calendar tab if meeting is found
+    // Could implement notification here
+  }, []);
 
-  const tabs = [
+  const tabs = useMemo(() => [
     {
       label: 'Summary',
       icon: <Summarize />,
@@ -67,14 +93,8 @@ const AIAssistantPanel: React.FC<AIAssistantPanelProps> = ({
         <SummaryTab 
           emailId={emailId} 
           threadId={threadId}
-          onTasksFound={() => {
-            // Auto-switch to tasks tab if tasks are found
-            // Could implement notification here
-          }}
-          onMeetingFound={() => {
-            // Auto-switch to calendar tab if meeting is found
-            // Could implement notification here
-          }}
+          onTasksFound={handleTasksFound}
+          onMeetingFound={handleMeetingFound}
         />
       ),
     },
@@ -93,7 +113,7 @@ const AIAssistantPanel: React.FC<AIAssistantPanelProps> = ({
       icon: <Event />,
       component: <CalendarTab emailId={emailId} />,
     },
-  ];
+  ], [emailId, threadId, handleTasksFound, handleMeetingFound]);
 
   return (
     <Paper
@@ -149,7 +169,12 @@ const AIAssistantPanel: React.FC<AIAssistantPanelProps> = ({
 
       {/* Tab Content */}
       {tabs.map((tab, index) => (
-        <TabPanel key={index} value={selectedTab} index={index}>
+        <TabPanel
+          key={index}
+          value={selectedTab}
+          index={index}
+          keepMounted={visitedTabs.indexOf(index) !== -1}
+        >
           {tab.component}
         </TabPanel>
       ))}
@@ -70,9 +70,6 @@ const CalendarTab: React.FC<CalendarTabProps> = ({ emailId }) => {
     setAddingToCalendar(true);
     
     try {
-      // Simulate adding to calendar
-      await new Promise(resolve => setTimeout(resolve, 2000));
-      
       // In real implementation, call calendar API
       console.log('Meeting accepted and added to calendar');
     } catch (err) {
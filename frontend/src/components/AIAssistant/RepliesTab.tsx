@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, useCallback } from 'react';
 import {
   Box,
   Typography,
@@ -43,11 +43,255 @@ interface ReplyOption {
   confidence: number;
 }
 
+const getToneIcon = (tone: string) => {
+  switch (tone.toLowerCase()) {
+    case 'professional': return '💼';
+    case 'friendly': return '😊';
+    case 'quick': return '⚡';
+    case 'detailed': return '📋';
+    case 'action-oriented': return '🎯';
+    default: return '💬';
+  }
+};
+
+const getToneColor = (tone: string) => {
+  switch (tone.toLowerCase()) {
+    case 'professional': return 'primary';
+    case 'friendly': return 'success';
+    case 'quick': return 'warning';
+    case 'detailed': return 'info';
+    case 'action-oriented': return 'error';
+    default: return 'default';
+  }
+};
+
+interface ReplyCardProps {
+  reply: ReplyOption;
+  index: number;
+  isSmartReply: boolean;
+  isSelected: boolean;
+  isCustomizing: boolean;
+  isCopied: boolean;
+  customReply: string;
+  onToggleSelect: (index: number) => void;
+  onCopy: (reply: ReplyOption, index: number) => void;
+  onCustomize: (index: number, reply: ReplyOption) => void;
+  onCustomReplyChange: (value: string) => void;
+  onSaveCustomization: () => void;
+  onCancelCustomization: () => void;
+}
+
+// Memoized so selecting, copying or typing into one card doesn't re-render
+// every other reply card
+const ReplyCard = React.memo(({
+  reply,
+  index,
+  isSmartReply,
+  isSelected,
+  isCustomizing,
+  isCopied,
+  customReply,
+  onToggleSelect,
+  onCopy,
+  onCustomize,
+  onCustomReplyChange,
+  onSaveCustomization,
+  onCancelCustomization,
+}: ReplyCardProps) => (
+  <Card
+    variant={isSelected ? 'elevation' : 'outlined'}
+    sx={{
+      mb: 2,
+      border: isSelected ? '2px solid' : undefined,
+      borderColor: isSelected ? 'primary.main' : undefined,
+      position: 'relative',
+      transition: 'all 0.2s ease',
+      '&:hover': {
+        elevation: 2,
+        transform: 'translateY(-1px)',
+      },
+    }}
+  >
+    {/* Smart Reply Badge */}
+    {isSmartReply && (
+      <Chip
+        label="Smart Reply"
+        icon={<AutoAwesome />}
+        size="small"
+        color="primary"
+        sx={{
+          position: 'absolute',
+          top: 8,
+          right: 8,
+          zIndex: 1,
+        }}
+      />
+    )}
+
+    <CardContent onClick={() => onToggleSelect(index)}>
+      {/* Header */}
+      <Box sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 2 }}>
+        <Typography variant="h6" sx={{ flex: 1 }}>
+          {getToneIcon(reply.tone)} {reply.type}
+        </Typography>
+        
+        <Chip
+          label={reply.tone}
+          size="small"
+          color={getToneColor(reply.tone) as any}
+          variant="outlined"
+        />
+        
+        <Chip
+          label={`${Math.round(reply.confidence * 100)}% confidence`}
+          size="small"
+          color={reply.confidence > 0.8 ? 'success' : reply.confidence > 0.6 ? 'warning' : 'error'}
+        />
+      </Box>
+
+      {/* Subject */}
+      <Typography variant="subtitle2" color="text.secondary" sx={{ mb: 1 }}>
+        Subject: {reply.subject}
+      </Typography>
+
+      {/* Body Preview */}
+      <Box
+        sx={{
+          p: 2,
+          backgroundColor: 'background.default',
+          borderRadius: 1,
+          border: '1px solid',
+          borderColor: 'divider',
+          cursor: 'pointer',
+        }}
+      >
+        {isCustomizing ? (
+          <TextField
+            multiline
+            rows={6}
+            value={customReply}
+            onChange={(e) => onCustomReplyChange(e.target.value)}
+            fullWidth
+            variant="outlined"
+            onClick={(e) => e.stopPropagation()}
+          />
+        ) : (
+          <Typography
+            variant="body2"
+            sx={{
+              whiteSpace: 'pre-wrap',
+              wordBreak: 'break-word',
+              lineHeight: 1.6,
+              display: '-webkit-box',
+              WebkitLineClamp: isSelected ? 'none' : 3,
+              WebkitBoxOrient: 'vertical',
+              overflow: isSelected ? 'visible' : 'hidden',
+            }}
+          >
+            {reply.body}
+          </Typography>
+        )}
+      </Box>
+
+      {/* Expand/Collapse indicator */}
+      {!isSelected && reply.body.length > 200 && (
+        <Box sx={{ textAlign: 'center', mt: 1 }}>
+          <IconButton size="small">
+            <ExpandMore />
+          </IconButton>
+        </Box>
+      )}
+    </CardContent>
+
+    {/* Actions */}
+    <CardActions sx={{ justifyContent: 'space-between', px: 2, pb: 2 }}>
+      <Box sx={{ display: 'flex', gap: 1 }}>
+        {isCustomizing ? (
+          <>
+            <Button
+              size="small"
+              variant="contained"
+              onClick={(e) => {
+                e.stopPropagation();
+                onSaveCustomization();
+              }}
+            >
+              Save
+            </Button>
+            <Button
+              size="small"
+              onClick={(e) => {
+                e.stopPropagation();
+                onCancelCustomization();
+              }}
+            >
+              Cancel
+            </Button>
+          </>
+        ) : (
+          <>
+            <Button
+              startIcon={isCopied ? <ThumbUp /> : <ContentCopy />}
+              size="small"
+              variant="outlined"
+              color={isCopied ? 'success' : 'primary'}
+              onClick={(e) => {
+                e.stopPropagation();
+                onCopy(reply, index);
+              }}
+            >
+              {isCopied ? 'Copied!' : 'Copy'}
+            </Button>
+            
+            <Button
+              startIcon={<Edit />}
+              size="small"
+              variant="outlined"
+              onClick={(e) => {
+                e.stopPropagation();
+                onCustomize(index, reply);
+              }}
+            >
+              Customize
+            </Button>
+            
+            <Button
+              startIcon={<Send />}
+              size="small"
+              variant="contained"
+              onClick={(e) => {
+                e.stopPropagation();
+                // Handle send
+              }}
+            >
+              Send
+            </Button>
+          </>
+        )}
+      </Box>
+
+      <Box sx={{ display: 'flex', gap: 0.5 }}>
+        <Tooltip title="This reply is helpful">
+          <IconButton size="small">
+            <ThumbUp fontSize="small" />
+          </IconButton>
+        </Tooltip>
+        <Tooltip title="This reply needs improvement">
+          <IconButton size="small">
+            <ThumbDown fontSize="small" />
+          </IconButton>
+        </Tooltip>
+      </Box>
+    </CardActions>
+  </Card>
+));
+
 const RepliesTab: React.FC<RepliesTabProps> = ({ emailId }) => {
   const [selectedReply, setSelectedReply] = useState<number | null>(null);
   const [customizing, setCustomizing] = useState<number | null>(null);
   const [customReply, setCustomReply] = useState('');
   const [copiedIndex, setCopiedIndex] = useState<number | null>(null);
+  const copiedTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   
   const {
     fastReplies,
@@ -64,244 +308,62 @@ const RepliesTab: React.FC<RepliesTabProps> = ({ emailId }) => {
     }
   }, [emailId, generateReplies]);
 
-  const handleCopyReply = async (reply: ReplyOption, index: number) => {
+  // Don't leave a pending "Copied!" reset running after unmount
+  useEffect(() => () => {
+    if (copiedTimerRef.current) clearTimeout(copiedTimerRef.current);
+  }, []);
+
+  const handleCopyReply = useCallback(async (reply: ReplyOption, index: number) => {
     try {
       await navigator.clipboard.writeText(reply.body);
       setCopiedIndex(index);
-      setTimeout(() => setCopiedIndex(null), 2000);
+      // Restart the reset timer instead of stacking one per click
+      if (copiedTimerRef.current) clearTimeout(copiedTimerRef.current);
+      copiedTimerRef.current = setTimeout(() => {
+        copiedTimerRef.current = null;
+        setCopiedIndex(null);
+      }, 2000);
     } catch (err) {
       console.error('Failed to copy text');
     }
-  };
+  }, []);
 
-  const handleCustomize = (index: number, reply: ReplyOption) => {
+  const handleCustomize = useCallback((index: number, reply: ReplyOption) => {
     setCustomizing(index);
     setCustomReply(reply.body);
-  };
+  }, []);
 
-  const handleSaveCustomization = () => {
+  const handleSaveCustomization = useCallback(() => {
     // In real implementation, save the customized reply
     setCustomizing(null);
     setCustomReply('');
-  };
-
-  const getToneIcon = (tone: string) => {
-    switch (tone.toLowerCase()) {
-      case 'professional': return '💼';
-      case 'friendly': return '😊';
-      case 'quick': return '⚡';
-      case 'detailed': return '📋';
-      case 'action-oriented': return '🎯';
-      default: return '💬';
-    }
-  };
-
-  const getToneColor = (tone: string) => {
-    switch (tone.toLowerCase()) {
-      case 'professional': return 'primary';
-      case 'friendly': return 'success';
-      case 'quick': return 'warning';
-      case 'detailed': return 'info';
-      case 'action-oriented': return 'error';
-      default: return 'default';
-    }
-  };
-
-  const renderReplyCard = (reply: ReplyOption, index: number, isSmartReply = false) => {
-    const isSelected = selectedReply === index;
-    const isCustomizing = customizing === index;
-    const isCopied = copiedIndex === index;
-
-    return (
-      <Card
-        key={index}
-        variant={isSelected ? 'elevation' : 'outlined'}
-        sx={{
-          mb: 2,
-          border: isSelected ? '2px solid' : undefined,
-          borderColor: isSelected ? 'primary.main' : undefined,
-          position: 'relative',
-          transition: 'all 0.2s ease',
-          '&:hover': {
-            elevation: 2,
-            transform: 'translateY(-1px)',
-          },
-        }}
-      >
-        {/* Smart Reply Badge */}
-        {isSmartReply && (
-          <Chip
-            label="Smart Reply"
-            icon={<AutoAwesome />}
-            size="small"
-            color="primary"
-            sx={{
-              position: 'absolute',
-              top: 8,
-              right: 8,
-              zIndex: 1,
-            }}
-          />
-        )}
-
-        <CardContent onClick={() => setSelectedReply(isSelected ? null : index)}>
-          {/* Header */}
-          <Box sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 2 }}>
-            <Typography variant="h6" sx={{ flex: 1 }}>
-              {getToneIcon(reply.tone)} {reply.type}
-            </Typography>
-            
-            <Chip
-              label={reply.tone}
-              size="small"
-              color={getToneColor(reply.tone) as any}
-              variant="outlined"
-            />
-            
-            <Chip
-              label={`${Math.round(reply.confidence * 100)}% confidence`}
-              size="small"
-              color={reply.confidence > 0.8 ? 'success' : reply.confidence > 0.6 ? 'warning' : 'error'}
-            />
-          </Box>
-
-          {/* Subject */}
-          <Typography variant="subtitle2" color="text.secondary" sx={{ mb: 1 }}>
-            Subject: {reply.subject}
-          </Typography>
-
-          {/* Body Preview */}
-          <Box
-            sx={{
-              p: 2,
-              backgroundColor: 'background.default',
-              borderRadius: 1,
-              border: '1px solid',
-              borderColor: 'divider',
-              cursor: 'pointer',
-            }}
-          >
-            {isCustomizing ? (
-              <TextField
-                multiline
-                rows={6}
-                value={customReply}
-                onChange={(e) => setCustomReply(e.target.value)}
-                fullWidth
-                variant="outlined"
-                onClick={(e) => e.stopPropagation()}
-              />
-            ) : (
-              <Typography
-                variant="body2"
-                sx={{
-                  whiteSpace: 'pre-wrap',
-                  wordBreak: 'break-word',
-                  lineHeight: 1.6,
-                  display: '-webkit-box',
-                  WebkitLineClamp: isSelected ? 'none' : 3,
-                  WebkitBoxOrient: 'vertical',
-                  overflow: isSelected ? 'visible' : 'hidden',
-                }}
-              >
-                {reply.body}
-              </Typography>
-            )}
-          </Box>
+  }, []);
 
-          {/* Expand/Collapse indicator */}
-          {!isSelected && reply.body.length > 200 && (
-            <Box sx={{ textAlign: 'center', mt: 1 }}>
-              <IconButton size="small">
-                <ExpandMore />
-              </IconButton>
-            </Box>
-          )}
-        </CardContent>
+  const handleCancelCustomization = useCallback(() => setCustomizing(null), []);
 
-        {/* Actions */}
-        <CardActions sx={{ justifyContent: 'space-between', px: 2, pb: 2 }}>
-          <Box sx={{ display: 'flex', gap: 1 }}>
-            {isCustomizing ? (
-              <>
-                <Button
-                  size="small"
-                  variant="contained"
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    handleSaveCustomization();
-                  }}
-                >
-                  Save
-                </Button>
-                <Button
-                  size="small"
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    setCustomizing(null);
-                  }}
-                >
-                  Cancel
-                </Button>
-              </>
-            ) : (
-              <>
-                <Button
-                  startIcon={isCopied ? <ThumbUp /> : <ContentCopy />}
-                  size="small"
-                  variant="outlined"
-                  color={isCopied ? 'success' : 'primary'}
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    handleCopyReply(reply, index);
-                  }}
-                >
-                  {isCopied ? 'Copied!' : 'Copy'}
-                </Button>
-                
-                <Button
-                  startIcon={<Edit />}
-                  size="small"
-                  variant="outlined"
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    handleCustomize(index, reply);
-                  }}
-                >
-                  Customize
-                </Button>
-                
-                <Button
-                  startIcon={<Send />}
-                  size="small"
-                  variant="contained"
-                  onClick={(e) => {
-                    e.stopPropagation();
-                    // Handle send
-                  }}
-                >
-                  Send
-                </Button>
-              </>
-            )}
-          </Box>
+  const handleToggleSelect = useCallback((index: number) => {
+    setSelectedReply(prev => (prev === index ? null : index));
+  }, []);
 
-          <Box sx={{ display: 'flex', gap: 0.5 }}>
-            <Tooltip title="This reply is helpful">
-              <IconButton size="small">
-                <ThumbUp fontSize="small" />
-              </IconButton>
-            </Tooltip>
-            <Tooltip title="This reply needs improvement">
-              <IconButton size="small">
-                <ThumbDown fontSize="small" />
-              </IconButton>
-            </Tooltip>
-          </Box>
-        </CardActions>
-      </Card>
-    );
-  };
+  // Only the card being edited receives the draft text, so typing re-renders one card
+  const renderReplyCard = (reply: ReplyOption, index: number, isSmartReply = false) => (
+    <ReplyCard
+      key={index}
+      reply={reply}
+      index={index}
+      isSmartReply={isSmartReply}
+      isSelected={selectedReply === index}
+      isCustomizing={customizing === index}
+      isCopied={copiedIndex === index}
+      customReply={customizing === index ? customReply : ''}
+      onToggleSelect={handleToggleSelect}
+      onCopy={handleCopyReply}
+      onCustomize={handleCustomize}
+      onCustomReplyChange={setCustomReply}
+      onSaveCustomization={handleSaveCustomization}
+      onCancelCustomization={handleCancelCustomization}
+    />
+  );
 
   if (loading) {
     return (
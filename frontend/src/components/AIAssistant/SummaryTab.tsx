@@ -66,9 +66,8 @@ const SummaryTab: React.FC<SummaryTabProps> = ({
     
     try {
       // In real implementation, fetch email details
-      // For now, simulate data
-      await new Promise(resolve => setTimeout(resolve, 1000));
-      
+      // For now, use placeholder data (no artificial delay - the tab shouldn't
+      // sit behind a spinner on every email selection)
       setEmailData({
         sentiment: 0.2, // Slightly positive
         importance: 0.8, // High importance
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
   Box,
   List,
@@ -30,7 +30,12 @@ import {
   Person,
 } from '@mui/icons-material';
 import { format, parseISO, isToday, isYesterday } from 'date-fns';
-import { useEmails, Email } from '../../hooks/useApi';
+import { useEmails, prefetchReplies, Email } from '../../hooks/useApi';
+import { formatDateCached } from '../../utils/dateFormat';
+
+// Rows are mounted in pages as the user scrolls, so long result lists only
+// pay for what's near the viewport
+const ROWS_PER_PAGE = 50;
 
 interface SmartInboxProps {
   onEmailSelect: (emailId: string, threadId: string) => void;
@@ -51,6 +56,149 @@ const TabPanel: React.FC<TabPanelProps> = ({ children, value, index }) => (
   </div>
 );
 
+const formatTime = (dateString: string) => formatDateCached(dateString, 'h:mm a');
+
+const getPriorityColor = (urgency: string) => {
+  switch (urgency) {
+    case 'urgent': return 'error';
+    case 'high': return 'warning';
+    case 'medium': return 'info';
+    case 'low': return 'success';
+    default: return 'default';
+  }
+};
+
+const getLabelIcon = (label: string) => {
+  switch (label) {
+    case 'meeting': return <Event fontSize="small" />;
+    case 'billing': return <Assignment fontSize="small" />;
+    case 'urgent': return <PriorityHigh fontSize="small" />;
+    default: return <Label fontSize="small" />;
+  }
+};
+
+interface EmailListItemProps {
+  email: Email;
+  selected: boolean;
+  onEmailSelect: (emailId: string, threadId: string) => void;
+}
+
+// Memoized so selecting an email or typing a search only re-renders rows whose
+// props actually changed
+const EmailListItem = React.memo(({ email, selected, onEmailSelect }: EmailListItemProps) => (
+  <ListItem disablePadding>
+    <ListItemButton
+      selected={selected}
+      onClick={() => onEmailSelect(email.id, email.thread_id)}
+      sx={{
+        borderLeft: selected ? 3 : 0,
+        borderColor: 'primary.main',
+        backgroundColor: email.is_unread ? 'action.hover' : 'transparent',
+        '&:hover': {
+          backgroundColor: 'action.hover',
+        },
+      }}
+    >
+      <ListItemAvatar>
+        <Badge
+          color="primary"
+          variant="dot"
+          invisible={!email.is_unread}
+        >
+          <Avatar
+            sx={{
+              width: 40,
+              height: 40,
+              fontSize: '0.875rem',
+              backgroundColor: 'primary.main',
+            }}
+          >
+            <Person />
+          </Avatar>
+        </Badge>
+      </ListItemAvatar>
+
+      <ListItemText
+        primaryTypographyProps={{ component: 'div' }}
+        secondaryTypographyProps={{ component: 'div' }}
+        primary={
+          <Box component="div" sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 0.5 }}>
+            <Typography
+              component="div"
+              variant="body2"
+              fontWeight={email.is_unread ? 600 : 400}
+              noWrap
+              sx={{ flex: 1, minWidth: 0 }}
+            >
+              {email.sender.split('<')[0].trim() || email.sender_email}
+            </Typography>
+            <Typography component="div" variant="caption" color="text.secondary">
+              {formatTime(email.date_received)}
+            </Typography>
+          </Box>
+        }
+        secondary={
+          <Box component="div">
+            <Typography
+              component="div"
+              variant="body2"
+              fontWeight={email.is_unread ? 500 : 400}
+              sx={{
+                mb: 0.5,
+                display: '-webkit-box',
+                WebkitLineClamp: 1,
+                WebkitBoxOrient: 'vertical',
+                overflow: 'hidden',
+              }}
+            >
+              {email.subject || '(No subject)'}
+            </Typography>
+            
+            <Typography
+              component="div"
+              variant="caption"
+              color="text.secondary"
+              sx={{
+                display: '-webkit-box',
+                WebkitLineClamp: 2,
+                WebkitBoxOrient: 'vertical',
+                overflow: 'hidden',
+                mb: 1,
+              }}
+            >
+              {email.body_text?.slice(0, 120)}...
+            </Typography>
+
+            {/* Labels */}
+            <Box component="div" sx={{ display: 'flex', gap: 0.5, flexWrap: 'wrap' }}>
+              {email.labels?.slice(0, 2).map((label, index) => (
+                <Chip
+                  key={index}
+                  label={label}
+                  size="small"
+                  variant="filled"
+                  color={getPriorityColor(email.urgency_level || 'medium') as any}
+                  icon={getLabelIcon(label)}
+                  sx={{ fontSize: '0.6rem', height: 20 }}
+                />
+              ))}
+              {email.requires_response && (
+                <Chip
+                  label="Response needed"
+                  size="small"
+                  color="warning"
+                  variant="outlined"
+                  sx={{ fontSize: '0.6rem', height: 20 }}
+                />
+              )}
+            </Box>
+          </Box>
+        }
+      />
+    </ListItemButton>
+  </ListItem>
+));
+
 const SmartInbox: React.FC<SmartInboxProps> = ({
   onEmailSelect,
   selectedEmailId,
@@ -79,6 +227,52 @@ const SmartInbox: React.FC<SmartInboxProps> = ({
   // Use search results if searching, otherwise use filtered emails
   const displayEmails = searchQuery ? searchResults : emails;
 
+  const [renderLimit, setRenderLimit] = useState(ROWS_PER_PAGE);
+  const sentinelRef = useRef<HTMLDivElement | null>(null);
+
+  // A new list starts again from the first page
+  useEffect(() => {
+    setRenderLimit(ROWS_PER_PAGE);
+  }, [displayEmails, selectedTab]);
+
+  // Rows that would be shown with no limit (collapsed groups show none)
+  const renderableCount = selectedTab === 0
+    ? displayEmails.filter(email => expandedSections[email.primary_label || 'general']).length
+    : displayEmails.length;
+  const hasHiddenRows = renderLimit < renderableCount;
+
+  // Mount the next page once the end-of-list sentinel nears the viewport
+  useEffect(() => {
+    const sentinel = sentinelRef.current;
+    if (!hasHiddenRows || !sentinel) return;
+    
+    if (typeof IntersectionObserver === 'undefined') {
+      setRenderLimit(renderableCount);
+      return;
+    }
+    
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) {
+        setRenderLimit(limit => limit + ROWS_PER_PAGE);
+      }
+    }, { rootMargin: '400px' });
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [hasHiddenRows, renderLimit, renderableCount]);
+
+  // Warm the reply cache for the top of the list while the user is reading it
+  useEffect(() => {
+    if (displayEmails.length === 0) return;
+    const topIds = displayEmails.slice(0, 3).map(email => email.id);
+    
+    if (typeof window.requestIdleCallback === 'function') {
+      const handle = window.requestIdleCallback(() => prefetchReplies(topIds));
+      return () => window.cancelIdleCallback(handle);
+    }
+    const timer = setTimeout(() => prefetchReplies(topIds), 500);
+    return () => clearTimeout(timer);
+  }, [displayEmails]);
+
   const handleTabChange = (event: React.SyntheticEvent, newValue: number) => {
     setSelectedTab(newValue);
   };
@@ -101,33 +295,6 @@ const SmartInbox: React.FC<SmartInboxProps> = ({
     }
   };
 
-  const formatTime = (dateString: string) => {
-    try {
-      return format(parseISO(dateString), 'h:mm a');
-    } catch {
-      return '';
-    }
-  };
-
-  const getPriorityColor = (urgency: string) => {
-    switch (urgency) {
-      case 'urgent': return 'error';
-      case 'high': return 'warning';
-      case 'medium': return 'info';
-      case 'low': return 'success';
-      default: return 'default';
-    }
-  };
-
-  const getLabelIcon = (label: string) => {
-    switch (label) {
-      case 'meeting': return <Event fontSize="small" />;
-      case 'billing': return <Assignment fontSize="small" />;
-      case 'urgent': return <PriorityHigh fontSize="small" />;
-      default: return <Label fontSize="small" />;
-    }
-  };
-
   const getInitials = (sender: string) => {
     return sender
       .split(' ')
@@ -152,152 +319,54 @@ const SmartInbox: React.FC<SmartInboxProps> = ({
   };
 
   const renderEmailItem = (email: Email) => (
-    <ListItem key={email.id} disablePadding>
-      <ListItemButton
-        selected={selectedEmailId === email.id}
-        onClick={() => onEmailSelect(email.id, email.thread_id)}
-        sx={{
-          borderLeft: selectedEmailId === email.id ? 3 : 0,
-          borderColor: 'primary.main',
-          backgroundColor: email.is_unread ? 'action.hover' : 'transparent',
-          '&:hover': {
-            backgroundColor: 'action.hover',
-          },
-        }}
-      >
-        <ListItemAvatar>
-          <Badge
-            color="primary"
-            variant="dot"
-            invisible={!email.is_unread}
-          >
-            <Avatar
-              sx={{
-                width: 40,
-                height: 40,
-                fontSize: '0.875rem',
-                backgroundColor: 'primary.main',
-              }}
-            >
-              <Person />
-            </Avatar>
-          </Badge>
-        </ListItemAvatar>
-
-        <ListItemText
-          primaryTypographyProps={{ component: 'div' }}
-          secondaryTypographyProps={{ component: 'div' }}
-          primary={
-            <Box component="div" sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 0.5 }}>
-              <Typography
-                component="div"
-                variant="body2"
-                fontWeight={email.is_unread ? 600 : 400}
-                noWrap
-                sx={{ flex: 1, minWidth: 0 }}
-              >
-                {email.sender.split('<')[0].trim() || email.sender_email}
-              </Typography>
-              <Typography component="div" variant="caption" color="text.secondary">
-                {formatTime(email.date_received)}
-              </Typography>
-            </Box>
-          }
-          secondary={
-            <Box component="div">
-              <Typography
-                component="div"
-                variant="body2"
-                fontWeight={email.is_unread ? 500 : 400}
-                sx={{
-                  mb: 0.5,
-                  display: '-webkit-box',
-                  WebkitLineClamp: 1,
-                  WebkitBoxOrient: 'vertical',
-                  overflow: 'hidden',
-                }}
-              >
-                {email.subject || '(No subject)'}
-              </Typography>
-              
-              <Typography
-                component="div"
-                variant="caption"
-                color="text.secondary"
-                sx={{
-                  display: '-webkit-box',
-                  WebkitLineClamp: 2,
-                  WebkitBoxOrient: 'vertical',
-                  overflow: 'hidden',
-                  mb: 1,
-                }}
-              >
-                {email.body_text?.slice(0, 120)}...
-              </Typography>
-
-              {/* Labels */}
-              <Box component="div" sx={{ display: 'flex', gap: 0.5, flexWrap: 'wrap' }}>
-                {email.labels?.slice(0, 2).map((label, index) => (
-                  <Chip
-                    key={index}
-                    label={label}
-                    size="small"
-                    variant="filled"
-                    color={getPriorityColor(email.urgency_level || 'medium') as any}
-                    icon={getLabelIcon(label)}
-                    sx={{ fontSize: '0.6rem', height: 20 }}
-                  />
-                ))}
-                {email.requires_response && (
-                  <Chip
-                    label="Response needed"
-                    size="small"
-                    color="warning"
-                    variant="outlined"
-                    sx={{ fontSize: '0.6rem', height: 20 }}
-                  />
-                )}
-              </Box>
-            </Box>
-          }
-        />
-      </ListItemButton>
-    </ListItem>
+    <EmailListItem
+      key={email.id}
+      email={email}
+      selected={selectedEmailId === email.id}
+      onEmailSelect={onEmailSelect}
+    />
   );
 
   const renderGroupedEmails = () => {
     const groups = groupEmailsByLabel(displayEmails);
+    // Expanded groups share the page budget in display order
+    let remaining = renderLimit;
     
-    return Object.entries(groups).map(([label, groupEmails]) => (
-      <Box key={label}>
-        <ListItem>
-          <ListItemButton
-            onClick={() => toggleSection(label)}
-            sx={{ py: 1 }}
-          >
-            <ListItemText
-              primary={
-                <Typography variant="subtitle2" fontWeight="bold">
-                  {label.charAt(0).toUpperCase() + label.slice(1).replace('_', ' ')}
-                  <Typography component="span" variant="caption" sx={{ ml: 1 }}>
-                    ({groupEmails.length})
+    return Object.entries(groups).map(([label, groupEmails]) => {
+      const visibleEmails = groupEmails.slice(0, Math.max(remaining, 0));
+      if (expandedSections[label]) remaining -= visibleEmails.length;
+      
+      return (
+        <Box key={label}>
+          <ListItem>
+            <ListItemButton
+              onClick={() => toggleSection(label)}
+              sx={{ py: 1 }}
+            >
+              <ListItemText
+                primary={
+                  <Typography variant="subtitle2" fontWeight="bold">
+                    {label.charAt(0).toUpperCase() + label.slice(1).replace('_', ' ')}
+                    <Typography component="span" variant="caption" sx={{ ml: 1 }}>
+                      ({groupEmails.length})
+                    </Typography>
                   </Typography>
-                </Typography>
-              }
-            />
-            <IconButton size="small">
-              {expandedSections[label] ? <ExpandLess /> : <ExpandMore />}
-            </IconButton>
-          </ListItemButton>
-        </ListItem>
+                }
+              />
+              <IconButton size="small">
+                {expandedSections[label] ? <ExpandLess /> : <ExpandMore />}
+              </IconButton>
+            </ListItemButton>
+          </ListItem>
         
-        <Collapse in={expandedSections[label]}>
-          {groupEmails.map(renderEmailItem)}
-        </Collapse>
+          <Collapse in={expandedSections[label]} unmountOnExit>
+            {visibleEmails.map(renderEmailItem)}
+          </Collapse>
         
-        <Divider />
-      </Box>
-    ));
+          <Divider />
+        </Box>
+      );
+    });
   };
 
   if (error) {
@@ -347,9 +416,10 @@ const SmartInbox: React.FC<SmartInboxProps> = ({
         ) : (
           // Show flat list for filtered tabs
           <List sx={{ py: 0 }}>
-            {displayEmails.map(renderEmailItem)}
+            {displayEmails.slice(0, renderLimit).map(renderEmailItem)}
           </List>
         )}
+        {!loading && hasHiddenRows && <div ref={sentinelRef} style={{ height: 1 }} />}
       </Box>
     </Box>
   );
@@ -1,4 +1,4 @@
-import React, { useState, useContext } from 'react';
+import React, { useState, useContext, useCallback, useDeferredValue } from 'react';
 import {
   AppBar,
   Box,
@@ -49,6 +49,11 @@ const MainLayout: React.FC<MainLayoutProps> = ({ children }) => {
   const [mobileOpen, setMobileOpen] = useState(false);
   const [selectedThreadId, setSelectedThreadId] = useState<string | null>(null);
   const [selectedEmailId, setSelectedEmailId] = useState<string | null>(null);
+
+  // The inbox highlight follows a click immediately; the heavier thread and
+  // assistant panes render from deferred copies so they can't hold up that paint
+  const detailThreadId = useDeferredValue(selectedThreadId);
+  const detailEmailId = useDeferredValue(selectedEmailId);
   const [searchQuery, setSearchQuery] = useState('');
 
   // Theme
@@ -79,10 +84,11 @@ const MainLayout: React.FC<MainLayoutProps> = ({ children }) => {
     }
   };
 
-  const handleEmailSelect = (emailId: string, threadId: string) => {
+  // Stable identity so memoized inbox rows don't re-render on every layout render
+  const handleEmailSelect = useCallback((emailId: string, threadId: string) => {
     setSelectedEmailId(emailId);
     setSelectedThreadId(threadId);
-  };
+  }, []);
 
   const handleRefresh = () => {
     startSync(24, true);
@@ -249,14 +255,14 @@ const MainLayout: React.FC<MainLayoutProps> = ({ children }) => {
               <Grid 
                 item 
                 xs={12} 
-                md={selectedEmailId ? 6 : 12} 
-                lg={selectedEmailId ? 6 : 12}
+                md={detailEmailId ? 6 : 12} 
+                lg={detailEmailId ? 6 : 12}
                 sx={{ height: '100%', overflow: 'hidden' }}
               >
-                {selectedThreadId ? (
+                {detailThreadId ? (
                   <ThreadView
-                    threadId={selectedThreadId}
-                    selectedEmailId={selectedEmailId}
+                    threadId={detailThreadId}
+                    selectedEmailId={detailEmailId}
                     onEmailSelect={setSelectedEmailId}
                   />
                 ) : (
@@ -283,7 +289,7 @@ const MainLayout: React.FC<MainLayoutProps> = ({ children }) => {
               </Grid>
 
               {/* AI Assistant Panel */}
-              {selectedEmailId && (
+              {detailEmailId && (
                 <Grid 
                   item 
                   xs={12} 
@@ -297,8 +303,8 @@ const MainLayout: React.FC<MainLayoutProps> = ({ children }) => {
                   }}
                 >
                   <AIAssistantPanel 
-                    emailId={selectedEmailId}
-                    threadId={selectedThreadId}
+                    emailId={detailEmailId}
+                    threadId={detailThreadId}
                   />
                 </Grid>
               )}
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback } from 'react';
 import {
   Box,
   Paper,
@@ -26,8 +26,8 @@ import {
   Schedule,
   AttachFile,
 } from '@mui/icons-material';
-import { format, parseISO } from 'date-fns';
 import { useThread, Email } from '../../hooks/useApi';
+import { formatDateCached } from '../../utils/dateFormat';
 
 interface ThreadViewProps {
   threadId: string;
@@ -35,6 +35,251 @@ interface ThreadViewProps {
   onEmailSelect: (emailId: string) => void;
 }
 
+const formatDate = (dateString: string) =>
+  formatDateCached(dateString, 'MMM d, yyyy \'at\' h:mm a', dateString);
+
+const getInitials = (sender: string) => {
+  return sender
+    .split(' ')
+    .map(word => word[0])
+    .join('')
+    .toUpperCase()
+    .slice(0, 2);
+};
+
+const extractSenderName = (sender: string) => {
+  const match = sender.match(/^([^<]+)</);
+  return match ? match[1].trim() : sender.split('@')[0];
+};
+
+const extractSenderEmail = (sender: string) => {
+  const match = sender.match(/<([^>]+)>/);
+  return match ? match[1] : sender;
+};
+
+interface ThreadEmailCardProps {
+  email: Email;
+  isExpanded: boolean;
+  isSelected: boolean;
+  onToggle: (emailId: string) => void;
+}
+
+// Memoized so expanding or selecting one email doesn't re-render the rest of
+// the conversation; collapsed bodies (often large HTML) stay unmounted
+const ThreadEmailCard = React.memo(({
+  email,
+  isExpanded,
+  isSelected,
+  onToggle,
+}: ThreadEmailCardProps) => (
+  <Card
+    variant={isSelected ? 'elevation' : 'outlined'}
+    sx={{
+      mb: 2,
+      border: isSelected ? '2px solid' : undefined,
+      borderColor: isSelected ? 'primary.main' : undefined,
+      transition: 'all 0.2s ease',
+      '&:hover': {
+        elevation: 2,
+        transform: 'translateY(-1px)',
+      },
+    }}
+  >
+    {/* Email Header */}
+    <CardContent
+      sx={{
+        pb: isExpanded ? 2 : 1,
+        cursor: 'pointer',
+      }}
+      onClick={() => onToggle(email.id)}
+    >
+      <Box sx={{ display: 'flex', alignItems: 'center', gap: 2 }}>
+        <Avatar
+          sx={{
+            width: 40,
+            height: 40,
+            backgroundColor: 'primary.main',
+          }}
+        >
+          <Person />
+        </Avatar>
+
+        <Box sx={{ flex: 1, minWidth: 0 }}>
+          <Box sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 0.5 }}>
+            <Typography variant="subtitle2" fontWeight="bold" noWrap>
+              {extractSenderName(email.sender)}
+            </Typography>
+            <Typography variant="caption" color="text.secondary" noWrap>
+              {extractSenderEmail(email.sender)}
+            </Typography>
+            {email.is_unread && (
+              <Chip label="New" size="small" color="primary" />
+            )}
+          </Box>
+
+          <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
+            <Typography variant="caption" color="text.secondary">
+              {formatDate(email.date_received)}
+            </Typography>
+            {email.attachments_count && email.attachments_count > 0 && (
+              <Tooltip title={`${email.attachments_count} attachments`}>
+                <AttachFile fontSize="small" color="action" />
+              </Tooltip>
+            )}
+          </Box>
+        </Box>
+
+        <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
+          {/* Priority/Urgency indicator */}
+          {email.urgency_level && email.urgency_level !== 'normal' && (
+            <Chip
+              label={email.urgency_level}
+              size="small"
+              color={
+                email.urgency_level === 'urgent' ? 'error' :
+                email.urgency_level === 'high' ? 'warning' : 'info'
+              }
+            />
+          )}
+
+          <IconButton size="small">
+            {isExpanded ? <ExpandLess /> : <ExpandMore />}
+          </IconButton>
+        </Box>
+      </Box>
+
+      {/* Subject (always visible) */}
+      <Typography
+        variant="body1"
+        fontWeight={email.is_unread ? 600 : 400}
+        sx={{ mt: 1, mb: isExpanded ? 2 : 0 }}
+      >
+        {email.subject || '(No subject)'}
+      </Typography>
+
+      {/* Preview (when collapsed) */}
+      {!isExpanded && (
+        <Typography
+          variant="body2"
+          color="text.secondary"
+          sx={{
+            mt: 1,
+            display: '-webkit-box',
+            WebkitLineClamp: 2,
+            WebkitBoxOrient: 'vertical',
+            overflow: 'hidden',
+          }}
+        >
+          {email.body_text}
+        </Typography>
+      )}
+    </CardContent>
+
+    {/* Expanded Content */}
+    <Collapse in={isExpanded} unmountOnExit>
+      <CardContent sx={{ pt: 0 }}>
+        <Divider sx={{ mb: 2 }} />
+
+        {/* Email Body */}
+        <Box
+          sx={{
+            mb: 2,
+            p: 2,
+            backgroundColor: 'background.default',
+            borderRadius: 1,
+            border: '1px solid',
+            borderColor: 'divider',
+          }}
+        >
+          {email.body_html ? (
+            <Box
+              dangerouslySetInnerHTML={{ __html: email.body_html }}
+              sx={{
+                '& img': { maxWidth: '100%', height: 'auto' },
+                '& a': { color: 'primary.main' },
+                lineHeight: 1.6,
+              }}
+            />
+          ) : (
+            <Typography
+              variant="body2"
+              component="pre"
+              sx={{
+                whiteSpace: 'pre-wrap',
+                wordBreak: 'break-word',
+                fontFamily: 'inherit',
+                lineHeight: 1.6,
+              }}
+            >
+              {email.body_text}
+            </Typography>
+          )}
+        </Box>
+
+        {/* Labels */}
+        {email.labels && email.labels.length > 0 && (
+          <Box sx={{ mb: 2 }}>
+            <Typography variant="caption" color="text.secondary" sx={{ mb: 1, display: 'block' }}>
+              Labels:
+            </Typography>
+            <Box sx={{ display: 'flex', gap: 0.5, flexWrap: 'wrap' }}>
+              {email.labels.map((label, index) => (
+                <Chip
+                  key={index}
+                  label={label}
+                  size="small"
+                  variant="outlined"
+                />
+              ))}
+            </Box>
+          </Box>
+        )}
+
+        {/* Recipients (if expanded and not just sender) */}
+        {email.recipients && email.recipients.length > 1 && (
+          <Box sx={{ mb: 2 }}>
+            <Typography variant="caption" color="text.secondary" sx={{ mb: 1, display: 'block' }}>
+              To: {email.recipients.join(', ')}
+            </Typography>
+          </Box>
+        )}
+      </CardContent>
+
+      {/* Actions */}
+      <CardActions sx={{ justifyContent: 'space-between', px: 2, pb: 2 }}>
+        <Box sx={{ display: 'flex', gap: 1 }}>
+          <Button
+            startIcon={<Reply />}
+            size="small"
+            variant="outlined"
+            onClick={(e) => {
+              e.stopPropagation();
+              // Handle reply
+            }}
+          >
+            Reply
+          </Button>
+          <Button
+            startIcon={<Forward />}
+            size="small"
+            variant="outlined"
+            onClick={(e) => {
+              e.stopPropagation();
+              // Handle forward
+            }}
+          >
+            Forward
+          </Button>
+        </Box>
+
+        <IconButton size="small">
+          <MoreVert />
+        </IconButton>
+      </CardActions>
+    </Collapse>
+  </Card>
+));
+
 const ThreadView: React.FC<ThreadViewProps> = ({
   threadId,
   selectedEmailId,
@@ -63,256 +308,13 @@ const ThreadView: React.FC<ThreadViewProps> = ({
     }
   }, [thread, selectedEmailId]);
 
-  const toggleEmailExpansion = (emailId: string) => {
+  const toggleEmailExpansion = useCallback((emailId: string) => {
     setExpandedEmails(prev => ({
       ...prev,
       [emailId]: !prev[emailId],
     }));
     onEmailSelect(emailId);
-  };
-
-  const formatDate = (dateString: string) => {
-    try {
-      return format(parseISO(dateString), 'MMM d, yyyy \'at\' h:mm a');
-    } catch {
-      return dateString;
-    }
-  };
-
-  const getInitials = (sender: string) => {
-    return sender
-      .split(' ')
-      .map(word => word[0])
-      .join('')
-      .toUpperCase()
-      .slice(0, 2);
-  };
-
-  const extractSenderName = (sender: string) => {
-    const match = sender.match(/^([^<]+)</);
-    return match ? match[1].trim() : sender.split('@')[0];
-  };
-
-  const extractSenderEmail = (sender: string) => {
-    const match = sender.match(/<([^>]+)>/);
-    return match ? match[1] : sender;
-  };
-
-  const renderEmailCard = (email: Email, index: number) => {
-    const isExpanded = expandedEmails[email.id];
-    const isSelected = selectedEmailId === email.id;
-    const isLatest = index === (thread?.emails.length || 0) - 1;
-    
-    return (
-      <Card
-        key={email.id}
-        variant={isSelected ? 'elevation' : 'outlined'}
-        sx={{
-          mb: 2,
-          border: isSelected ? '2px solid' : undefined,
-          borderColor: isSelected ? 'primary.main' : undefined,
-          transition: 'all 0.2s ease',
-          '&:hover': {
-            elevation: 2,
-            transform: 'translateY(-1px)',
-          },
-        }}
-      >
-        {/* Email Header */}
-        <CardContent
-          sx={{
-            pb: isExpanded ? 2 : 1,
-            cursor: 'pointer',
-          }}
-          onClick={() => toggleEmailExpansion(email.id)}
-        >
-          <Box sx={{ display: 'flex', alignItems: 'center', gap: 2 }}>
-            <Avatar
-              sx={{
-                width: 40,
-                height: 40,
-                backgroundColor: 'primary.main',
-              }}
-            >
-              <Person />
-            </Avatar>
-
-            <Box sx={{ flex: 1, minWidth: 0 }}>
-              <Box sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 0.5 }}>
-                <Typography variant="subtitle2" fontWeight="bold" noWrap>
-                  {extractSenderName(email.sender)}
-                </Typography>
-                <Typography variant="caption" color="text.secondary" noWrap>
-                  {extractSenderEmail(email.sender)}
-                </Typography>
-                {email.is_unread && (
-                  <Chip label="New" size="small" color="primary" />
-                )}
-              </Box>
-
-              <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
-                <Typography variant="caption" color="text.secondary">
-                  {formatDate(email.date_received)}
-                </Typography>
-                {email.attachments_count && email.attachments_count > 0 && (
-                  <Tooltip title={`${email.attachments_count} attachments`}>
-                    <AttachFile fontSize="small" color="action" />
-                  </Tooltip>
-                )}
-              </Box>
-            </Box>
-
-            <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
-              {/* Priority/Urgency indicator */}
-              {email.urgency_level && email.urgency_level !== 'normal' && (
-                <Chip
-                  label={email.urgency_level}
-                  size="small"
-                  color={
-                    email.urgency_level === 'urgent' ? 'error' :
-                    email.urgency_level === 'high' ? 'warning' : 'info'
-                  }
-                />
-              )}
-
-              <IconButton size="small">
-                {isExpanded ? <ExpandLess /> : <ExpandMore />}
-              </IconButton>
-            </Box>
-          </Box>
-
-          {/* Subject (always visible) */}
-          <Typography
-            variant="body1"
-            fontWeight={email.is_unread ? 600 : 400}
-            sx={{ mt: 1, mb: isExpanded ? 2 : 0 }}
-          >
-            {email.subject || '(No subject)'}
-          </Typography>
-
-          {/* Preview (when collapsed) */}
-          {!isExpanded && (
-            <Typography
-              variant="body2"
-              color="text.secondary"
-              sx={{
-                mt: 1,
-                display: '-webkit-box',
-                WebkitLineClamp: 2,
-                WebkitBoxOrient: 'vertical',
-                overflow: 'hidden',
-              }}
-            >
-              {email.body_text}
-            </Typography>
-          )}
-        </CardContent>
-
-        {/* Expanded Content */}
-        <Collapse in={isExpanded}>
-          <CardContent sx={{ pt: 0 }}>
-            <Divider sx={{ mb: 2 }} />
-
-            {/* Email Body */}
-            <Box
-              sx={{
-                mb: 2,
-                p: 2,
-                backgroundColor: 'background.default',
-                borderRadius: 1,
-                border: '1px solid',
-                borderColor: 'divider',
-              }}
-            >
-              {email.body_html ? (
-                <Box
-                  dangerouslySetInnerHTML={{ __html: email.body_html }}
-                  sx={{
-                    '& img': { maxWidth: '100%', height: 'auto' },
-                    '& a': { color: 'primary.main' },
-                    lineHeight: 1.6,
-                  }}
-                />
-              ) : (
-                <Typography
-                  variant="body2"
-                  component="pre"
-                  sx={{
-                    whiteSpace: 'pre-wrap',
-                    wordBreak: 'break-word',
-                    fontFamily: 'inherit',
-                    lineHeight: 1.6,
-                  }}
-                >
-                  {email.body_text}
-                </Typography>
-              )}
-            </Box>
-
-            {/* Labels */}
-            {email.labels && email.labels.length > 0 && (
-              <Box sx={{ mb: 2 }}>
-                <Typography variant="caption" color="text.secondary" sx={{ mb: 1, display: 'block' }}>
-                  Labels:
-                </Typography>
-                <Box sx={{ display: 'flex', gap: 0.5, flexWrap: 'wrap' }}>
-                  {email.labels.map((label, index) => (
-                    <Chip
-                      key={index}
-                      label={label}
-                      size="small"
-                      variant="outlined"
-                    />
-                  ))}
-                </Box>
-              </Box>
-            )}
-
-            {/* Recipients (if expanded and not just sender) */}
-            {email.recipients && email.recipients.length > 1 && (
-              <Box sx={{ mb: 2 }}>
-                <Typography variant="caption" color="text.secondary" sx={{ mb: 1, display: 'block' }}>
-                  To: {email.recipients.join(', ')}
-                </Typography>
-              </Box>
-            )}
-          </CardContent>
-
-          {/* Actions */}
-          <CardActions sx={{ justifyContent: 'space-between', px: 2, pb: 2 }}>
-            <Box sx={{ display: 'flex', gap: 1 }}>
-              <Button
-                startIcon={<Reply />}
-                size="small"
-                variant="outlined"
-                onClick={(e) => {
-                  e.stopPropagation();
-                  // Handle reply
-                }}
-              >
-                Reply
-              </Button>
-              <Button
-                startIcon={<Forward />}
-                size="small"
-                variant="outlined"
-                onClick={(e) => {
-                  e.stopPropagation();
-                  // Handle forward
-                }}
-              >
-                Forward
-              </Button>
-            </Box>
-
-            <IconButton size="small">
-              <MoreVert />
-            </IconButton>
-          </CardActions>
-        </Collapse>
-      </Card>
-    );
-  };
+  }, [onEmailSelect]);
 
   if (loading) {
     return (
@@ -383,7 +385,15 @@ const ThreadView: React.FC<ThreadViewProps> = ({
 
       {/* Emails */}
       <Box>
-        {thread.emails.map((email, index) => renderEmailCard(email, index))}
+        {thread.emails.map((email) => (
+          <ThreadEmailCard
+            key={email.id}
+            email={email}
+            isExpanded={!!expandedEmails[email.id]}
+            isSelected={selectedEmailId === email.id}
+            onToggle={toggleEmailExpansion}
+          />
+        ))}
       </Box>
     </Box>
   );
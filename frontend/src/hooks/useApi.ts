@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import axios, { AxiosResponse } from 'axios';
 
 // API client configuration
@@ -10,6 +10,25 @@ const api = axios.create({
   },
 });
 
+// Overlapping GETs for the same URL + params (refresh clicks, polls landing
+// together, several components mounting at once) share one request. Only for
+// calls without an AbortSignal - one caller aborting mustn't cancel the others.
+const inflightGets = new Map<string, Promise<AxiosResponse>>();
+
+const sharedGet = (url: string, params?: Record<string, any>): Promise<AxiosResponse> => {
+  const key = `${url}?${JSON.stringify(params || {})}`;
+  const pending = inflightGets.get(key);
+  if (pending) return pending;
+  
+  const request = api.get(url, { params });
+  const done = () => {
+    inflightGets.delete(key);
+  };
+  request.then(done, done);
+  inflightGets.set(key, request);
+  return request;
+};
+
 // Types
 export interface Email {
   id: string;
@@ -68,6 +87,73 @@ export interface ReplyOption {
   confidence: number;
 }
 
+// Recently generated replies per email, so re-selecting an email renders
+// instantly instead of re-requesting (Map keeps insertion order for LRU eviction)
+const REPLY_CACHE_TTL_MS = 120 * 1000;
+const REPLY_CACHE_MAX_ENTRIES = 50;
+const replyCache = new Map<string, { value: any; expiry: number }>();
+
+const getCachedReplies = (emailId: string) => {
+  const entry = replyCache.get(emailId);
+  if (!entry) return null;
+  
+  replyCache.delete(emailId);
+  if (entry.expiry < Date.now()) return null;
+  
+  // Re-insert to mark as most recently used
+  replyCache.set(emailId, entry);
+  return entry.value;
+};
+
+const setCachedReplies = (emailId: string, value: any) => {
+  replyCache.delete(emailId);
+  replyCache.set(emailId, { value, expiry: Date.now() + REPLY_CACHE_TTL_MS });
+  
+  if (replyCache.size > REPLY_CACHE_MAX_ENTRIES) {
+    const oldest = replyCache.keys().next().value;
+    if (oldest !== undefined) replyCache.delete(oldest);
+  }
+};
+
+const hasFreshReplies = (emailId: string) => {
+  const entry = replyCache.get(emailId);
+  return !!entry && entry.expiry >= Date.now();
+};
+
+// Speculative reply fetches for emails the user is likely to open next,
+// limited so a list render can't flood the server
+const MAX_PREFETCHES_IN_FLIGHT = 2;
+let prefetchesInFlight = 0;
+const prefetchQueue: string[] = [];
+
+const drainPrefetchQueue = () => {
+  while (prefetchesInFlight < MAX_PREFETCHES_IN_FLIGHT && prefetchQueue.length > 0) {
+    const emailId = prefetchQueue.shift() as string;
+    if (hasFreshReplies(emailId)) continue;
+    
+    prefetchesInFlight++;
+    const done = () => {
+      prefetchesInFlight--;
+      drainPrefetchQueue();
+    };
+    api.post('/reply_suggestions', null, { params: { email_id: emailId } })
+      .then(response => {
+        if (!hasFreshReplies(emailId)) setCachedReplies(emailId, response.data);
+      })
+      // Errors are left for the real request to surface
+      .then(done, done);
+  }
+};
+
+export const prefetchReplies = (emailIds: string[]) => {
+  emailIds.forEach(emailId => {
+    if (!hasFreshReplies(emailId) && prefetchQueue.indexOf(emailId) === -1) {
+      prefetchQueue.push(emailId);
+    }
+  });
+  drainPrefetchQueue();
+};
+
 // Custom hooks
 export const useEmails = (page = 1, perPage = 50, filters: any = {}) => {
   const [emails, setEmails] = useState<Email[]>([]);
@@ -75,8 +161,14 @@ export const useEmails = (page = 1, perPage = 50, filters: any = {}) => {
   const [error, setError] = useState<string | null>(null);
   const [totalCount, setTotalCount] = useState(0);
   const [hasMore, setHasMore] = useState(false);
+  const controllerRef = useRef<AbortController | null>(null);
 
   const fetchEmails = useCallback(async () => {
+    // Latest request wins - a slow response for an old tab/page can't overwrite it
+    controllerRef.current?.abort();
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    
     setLoading(true);
     setError(null);
     
@@ -87,16 +179,20 @@ export const useEmails = (page = 1, perPage = 50, filters: any = {}) => {
         ...filters,
       };
       
-      const response = await api.get('/emails', { params });
+      const response = await api.get('/emails', { params, signal: controller.signal });
       const data = response.data;
       
       setEmails(data.emails);
       setTotalCount(data.total_count);
       setHasMore(data.has_more);
     } catch (err: any) {
+      if (axios.isCancel(err)) return;
       setError(err.response?.data?.detail || 'Failed to fetch emails');
     } finally {
-      setLoading(false);
+      if (controllerRef.current === controller) {
+        controllerRef.current = null;
+        setLoading(false);
+      }
     }
   }, [page, perPage, JSON.stringify(filters)]);
 
@@ -104,6 +200,8 @@ export const useEmails = (page = 1, perPage = 50, filters: any = {}) => {
     fetchEmails();
   }, [fetchEmails]);
 
+  useEffect(() => () => controllerRef.current?.abort(), []);
+
   return {
     emails,
     loading,
@@ -118,20 +216,29 @@ export const useThread = (threadId: string) => {
   const [thread, setThread] = useState<Thread | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const controllerRef = useRef<AbortController | null>(null);
 
   const fetchThread = useCallback(async () => {
     if (!threadId) return;
     
+    controllerRef.current?.abort();
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    
     setLoading(true);
     setError(null);
     
     try {
-      const response = await api.get(`/threads/${threadId}`);
+      const response = await api.get(`/threads/${threadId}`, { signal: controller.signal });
       setThread(response.data);
     } catch (err: any) {
+      if (axios.isCancel(err)) return;
       setError(err.response?.data?.detail || 'Failed to fetch thread');
     } finally {
-      setLoading(false);
+      if (controllerRef.current === controller) {
+        controllerRef.current = null;
+        setLoading(false);
+      }
     }
   }, [threadId]);
 
@@ -139,6 +246,8 @@ export const useThread = (threadId: string) => {
     fetchThread();
   }, [fetchThread]);
 
+  useEffect(() => () => controllerRef.current?.abort(), []);
+
   return {
     thread,
     loading,
@@ -153,45 +262,133 @@ export const useReplyGeneration = () => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [generationTime, setGenerationTime] = useState(0);
+  const smartStreamRef = useRef<EventSource | null>(null);
+  const controllerRef = useRef<AbortController | null>(null);
+  const activeEmailRef = useRef<string | null>(null);
+
+  const closeSmartStream = useCallback(() => {
+    if (smartStreamRef.current) {
+      smartStreamRef.current.close();
+      smartStreamRef.current = null;
+    }
+  }, []);
+
+  // Don't keep a request or smart reply stream open for an unmounted panel
+  useEffect(() => () => {
+    controllerRef.current?.abort();
+    closeSmartStream();
+  }, [closeSmartStream]);
 
   const generateReplies = useCallback(async (emailId: string) => {
-    setLoading(true);
+    // Switching emails abandons whatever was in flight for the previous one
+    controllerRef.current?.abort();
+    controllerRef.current = null;
+    closeSmartStream();
+    activeEmailRef.current = emailId;
     setError(null);
-    setFastReplies([]);
     setSmartReply(null);
     
+    // Serve recently seen replies immediately; only go back to the server
+    // if the smart reply hadn't finished yet
+    const cached = getCachedReplies(emailId);
+    if (cached) {
+      setFastReplies(cached.fast_replies);
+      setGenerationTime(cached.generation_time_ms);
+      if (cached.smart_reply) {
+        setSmartReply(cached.smart_reply);
+        return;
+      }
+    } else {
+      setLoading(true);
+      setFastReplies([]);
+    }
+    
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    
     try {
       // Generate fast replies
       const response = await api.post('/reply_suggestions', null, {
-        params: { email_id: emailId }
+        params: { email_id: emailId },
+        signal: controller.signal,
       });
       
       const data = response.data;
       setFastReplies(data.fast_replies);
       setGenerationTime(data.generation_time_ms);
+      setCachedReplies(emailId, data);
       
-      // Poll for smart reply
-      if (data.smart_reply_task_id) {
-        pollSmartReply(data.smart_reply_task_id);
+      // Smart reply may already be cached server-side; otherwise wait for it
+      if (data.smart_reply) {
+        setSmartReply(data.smart_reply);
+      } else if (data.smart_reply_task_id) {
+        streamSmartReply(data.smart_reply_task_id, emailId);
       }
     } catch (err: any) {
+      if (axios.isCancel(err)) return;
       setError(err.response?.data?.detail || 'Failed to generate replies');
     } finally {
-      setLoading(false);
+      if (controllerRef.current === controller) {
+        controllerRef.current = null;
+        setLoading(false);
+      }
     }
-  }, []);
+  }, [closeSmartStream]);
+
+  const handleSmartResult = (emailId: string, result: ReplyOption) => {
+    if (activeEmailRef.current === emailId) setSmartReply(result);
+    const entry = replyCache.get(emailId);
+    if (entry) {
+      entry.value = { ...entry.value, smart_reply: result };
+    }
+  };
 
-  const pollSmartReply = async (taskId: string) => {
+  // Server pushes the smart reply the moment it's ready; polling is only a
+  // fallback for browsers/proxies where the stream can't be held open
+  const streamSmartReply = (taskId: string, emailId: string) => {
+    if (typeof EventSource === 'undefined') {
+      pollSmartReply(taskId, emailId);
+      return;
+    }
+    
+    const source = new EventSource(`${api.defaults.baseURL}/reply_suggestions/${taskId}/stream`);
+    smartStreamRef.current = source;
+    
+    source.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      
+      if (data.status === 'completed') {
+        closeSmartStream();
+        if (data.result) handleSmartResult(emailId, data.result);
+      } else if (data.status === 'error') {
+        closeSmartStream();
+        setError(data.error || 'Smart reply generation failed');
+      }
+    };
+    
+    source.onerror = () => {
+      // Dropped before a result arrived - finish by polling instead
+      if (smartStreamRef.current === source) {
+        closeSmartStream();
+        pollSmartReply(taskId, emailId);
+      }
+    };
+  };
+
+  const pollSmartReply = async (taskId: string, emailId: string) => {
     const maxAttempts = 30; // 30 seconds max
     let attempts = 0;
     
     const poll = async () => {
+      // User has moved on to another email
+      if (activeEmailRef.current !== emailId) return;
+      
       try {
-        const response = await api.get(`/reply_suggestions/${taskId}/smart`);
+        const response = await sharedGet(`/reply_suggestions/${taskId}/smart`);
         const data = response.data;
         
         if (data.status === 'completed' && data.result) {
-          setSmartReply(data.result);
+          handleSmartResult(emailId, data.result);
           return;
         } else if (data.status === 'error') {
           setError(data.error || 'Smart reply generation failed');
@@ -220,10 +417,14 @@ export const useReplyGeneration = () => {
   };
 };
 
+const SYNC_POLL_MIN_MS = 1000;
+const SYNC_POLL_MAX_MS = 5000;
+
 export const useEmailSync = () => {
   const [syncStatus, setSyncStatus] = useState<any>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const lastStatusRef = useRef<string | null>(null);
 
   const startSync = useCallback(async (hoursBack = 24, deltaSync = true) => {
     setLoading(true);
@@ -243,25 +444,35 @@ export const useEmailSync = () => {
     }
   }, []);
 
+  // Poll quickly while progress is moving, backing off (1s -> 2s -> 4s -> 5s)
+  // while a queued or long-running step reports nothing new
   const pollSyncStatus = async (taskId: string) => {
-    const maxAttempts = 120; // 2 minutes max
-    let attempts = 0;
+    const deadline = Date.now() + 2 * 60 * 1000; // 2 minutes max
+    let delay = SYNC_POLL_MIN_MS;
     
     const poll = async () => {
       try {
-        const response = await api.get(`/sync/${taskId}/status`);
+        const response = await sharedGet(`/sync/${taskId}/status`);
         const data = response.data;
         
-        setSyncStatus(data);
+        // Progress often sits still between polls - skip no-op re-renders
+        const statusKey = JSON.stringify(data);
+        const changed = statusKey !== lastStatusRef.current;
+        if (changed) {
+          lastStatusRef.current = statusKey;
+          setSyncStatus(data);
+        }
         
         if (data.status === 'completed' || data.status === 'error') {
+          // Synced mail can change what replies should say
+          if (data.status === 'completed') replyCache.clear();
           setLoading(false);
           return;
         }
         
-        attempts++;
-        if (attempts < maxAttempts) {
-          setTimeout(poll, 1000);
+        delay = changed ? SYNC_POLL_MIN_MS : Math.min(delay * 2, SYNC_POLL_MAX_MS);
+        if (Date.now() + delay < deadline) {
+          setTimeout(poll, delay);
         } else {
           setLoading(false);
           setError('Sync timeout');
@@ -345,37 +556,67 @@ export const useCalendarResponse = () => {
   };
 };
 
-export const useSearch = () => {
+export const useSearch = (debounceMs = 200) => {
   const [results, setResults] = useState<Email[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const controllerRef = useRef<AbortController | null>(null);
+
+  // Drop any pending keystroke timer and abort the in-flight request
+  const cancelPending = useCallback(() => {
+    if (timerRef.current) {
+      clearTimeout(timerRef.current);
+      timerRef.current = null;
+    }
+    if (controllerRef.current) {
+      controllerRef.current.abort();
+      controllerRef.current = null;
+    }
+  }, []);
+
+  const search = useCallback((query: string, limit = 20) => {
+    cancelPending();
 
-  const search = useCallback(async (query: string, limit = 20) => {
     if (!query.trim()) {
       setResults([]);
+      setLoading(false);
       return;
     }
     
-    setLoading(true);
-    setError(null);
-    
-    try {
-      const response = await api.get('/search', {
-        params: { q: query, limit }
-      });
+    timerRef.current = setTimeout(async () => {
+      const controller = new AbortController();
+      controllerRef.current = controller;
+      setLoading(true);
+      setError(null);
       
-      setResults(response.data.results);
-    } catch (err: any) {
-      setError(err.response?.data?.detail || 'Search failed');
-    } finally {
-      setLoading(false);
-    }
-  }, []);
+      try {
+        const response = await api.get('/search', {
+          params: { q: query.trim(), limit },
+          signal: controller.signal,
+        });
+        
+        setResults(response.data.results);
+      } catch (err: any) {
+        if (axios.isCancel(err)) return;
+        setError(err.response?.data?.detail || 'Search failed');
+      } finally {
+        if (controllerRef.current === controller) {
+          controllerRef.current = null;
+          setLoading(false);
+        }
+      }
+    }, debounceMs);
+  }, [cancelPending, debounceMs]);
+
+  useEffect(() => cancelPending, [cancelPending]);
 
   const clearSearch = useCallback(() => {
+    cancelPending();
     setResults([]);
     setError(null);
-  }, []);
+    setLoading(false);
+  }, [cancelPending]);
 
   return {
     results,
@@ -386,32 +627,84 @@ export const useSearch = () => {
   };
 };
 
+// Dashboard refresh: every 5 minutes while data keeps changing, backing off
+// to 30 minutes while it doesn't (or while requests fail)
+const DASHBOARD_REFRESH_MS = 5 * 60 * 1000;
+const DASHBOARD_MAX_REFRESH_MS = 30 * 60 * 1000;
+const DASHBOARD_MIN_WAKE_REFETCH_MS = 30 * 1000;
+
 export const useDashboard = () => {
   const [overview, setOverview] = useState<any>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const lastPayloadRef = useRef<string | null>(null);
+  const lastFetchRef = useRef(0);
 
+  // Resolves to whether the overview changed since the previous fetch
   const fetchOverview = useCallback(async () => {
     setLoading(true);
     setError(null);
+    lastFetchRef.current = Date.now();
     
     try {
-      const response = await api.get('/dashboard/overview');
-      setOverview(response.data);
+      const response = await sharedGet('/dashboard/overview');
+      const payload = JSON.stringify(response.data);
+      const changed = payload !== lastPayloadRef.current;
+      lastPayloadRef.current = payload;
+      // Identical data would only trigger a re-render of the same numbers
+      if (changed) setOverview(response.data);
+      return changed;
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Failed to fetch dashboard data');
+      return false;
     } finally {
       setLoading(false);
     }
   }, []);
 
   useEffect(() => {
-    fetchOverview();
+    let delay = DASHBOARD_REFRESH_MS;
+    let timer: ReturnType<typeof setTimeout> | null = null;
+    let cancelled = false;
     
-    // Refresh every 5 minutes
-    const interval = setInterval(fetchOverview, 5 * 60 * 1000);
-    return () => clearInterval(interval);
-  }, []);
+    // Always replaces any pending timer so overlapping ticks can't fork the loop
+    const schedule = () => {
+      if (timer) clearTimeout(timer);
+      if (!cancelled) timer = setTimeout(tick, delay);
+    };
+    
+    // Hidden tabs and offline browsers skip the request entirely
+    const tick = async () => {
+      if (!document.hidden && navigator.onLine) {
+        const changed = await fetchOverview();
+        delay = changed ? DASHBOARD_REFRESH_MS : Math.min(delay * 2, DASHBOARD_MAX_REFRESH_MS);
+      }
+      schedule();
+    };
+    
+    // Coming back to the tab (or back online) refreshes promptly and resets backoff
+    const handleWake = () => {
+      if (document.hidden || !navigator.onLine) return;
+      if (timer) clearTimeout(timer);
+      delay = DASHBOARD_REFRESH_MS;
+      if (Date.now() - lastFetchRef.current >= DASHBOARD_MIN_WAKE_REFETCH_MS) {
+        tick();
+      } else {
+        schedule();
+      }
+    };
+    
+    fetchOverview().then(schedule);
+    document.addEventListener('visibilitychange', handleWake);
+    window.addEventListener('online', handleWake);
+    
+    return () => {
+      cancelled = true;
+      if (timer) clearTimeout(timer);
+      document.removeEventListener('visibilitychange', handleWake);
+      window.removeEventListener('online', handleWake);
+    };
+  }, [fetchOverview]);
 
   return {
     overview,
@@ -0,0 +1,23 @@
+import { format, parseISO } from 'date-fns';
+
+// Formatted strings keyed by pattern + ISO timestamp - list rows and thread
+// cards re-render often with the same dates, so parse/format each one once
+const MAX_CACHED_DATES = 500;
+const formattedDates = new Map<string, string>();
+
+export const formatDateCached = (dateString: string, pattern: string, fallback = '') => {
+  const key = `${pattern}|${dateString}`;
+  const cached = formattedDates.get(key);
+  if (cached !== undefined) return cached;
+
+  let formatted: string;
+  try {
+    formatted = format(parseISO(dateString), pattern);
+  } catch {
+    formatted = fallback;
+  }
+
+  if (formattedDates.size >= MAX_CACHED_DATES) formattedDates.clear();
+  formattedDates.set(key, formatted);
+  return formatted;
+};
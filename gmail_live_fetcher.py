@@ -5,17 +5,31 @@ Fetches emails from past 10 days without database storage
 """
 
 import base64
-import email
+import logging
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from cachetools import TTLCache
 from auth import GoogleAuth
 
+logger = logging.getLogger(__name__)
+
 class GmailLiveFetcher:
     """Fetch emails directly from Gmail API for past 10 days"""
     
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 60, batch_size: int = 100):
         self.auth = GoogleAuth()
         self.service = None
+        # Messages fetched per batch HTTP request (Gmail allows up to 100)
+        self.batch_size = max(1, min(batch_size, 100))
+        
+        # Recent fetches keyed on days_back -> (max_results, exhausted, emails).
+        # Gmail lists newest first, so a cached fetch also covers any smaller
+        # max_results, and any larger one if the listing was exhausted.
+        self._cache = TTLCache(maxsize=16, ttl=cache_ttl)
+        self._cache_lock = threading.RLock()
+        # In-flight fetches keyed on days_back -> (max_results, done event)
+        self._inflight = {}
         
     def _get_service(self):
         """Get Gmail service with authentication"""
@@ -23,7 +37,7 @@ class GmailLiveFetcher:
             try:
                 self.service = self.auth.get_gmail_service()
             except Exception as e:
-                print(f"Gmail authentication failed: {e}")
+                logger.error("Gmail authentication failed: %s", e)
                 return None
         return self.service
     
@@ -38,6 +52,38 @@ class GmailLiveFetcher:
         Returns:
             List of email dictionaries with id, subject, sender, date, body, etc.
         """
+        waited = False
+        while True:
+            with self._cache_lock:
+                cached = self._get_cached(days_back, max_results)
+                if cached is not None:
+                    return cached
+                
+                # Coalesce concurrent callers: if an identical-or-larger fetch
+                # is already running, wait for it and reuse its result
+                flight = self._inflight.get(days_back)
+                if flight is None:
+                    done = threading.Event()
+                    self._inflight[days_back] = (max_results, done)
+                    break
+                flight_max, flight_done = flight
+            
+            if waited or flight_max < max_results:
+                # In-flight fetch can't cover us (or already failed to) - go direct
+                return self._fetch_from_gmail(days_back, max_results)
+            
+            flight_done.wait()
+            waited = True
+        
+        try:
+            return self._fetch_from_gmail(days_back, max_results)
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(days_back, None)
+            done.set()
+    
+    def _fetch_from_gmail(self, days_back: int, max_results: int) -> List[Dict]:
+        """List and fetch recent messages from the Gmail API, caching the result"""
         try:
             service = self._get_service()
             if not service:
@@ -50,7 +96,7 @@ class GmailLiveFetcher:
             # Gmail API query for recent emails
             query = f'after:{start_date.strftime("%Y/%m/%d")}'
             
-            print(f"Fetching emails from Gmail for past {days_back} days...")
+            logger.info("Fetching emails from Gmail for past %s days...", days_back)
             
             # Get message list
             results = service.users().messages().list(
@@ -60,30 +106,85 @@ class GmailLiveFetcher:
             ).execute()
             
             messages = results.get('messages', [])
-            print(f"Found {len(messages)} recent emails")
+            logger.info("Found %d recent emails", len(messages))
             
             emails = []
-            for i, message in enumerate(messages):
-                try:
-                    email_data = self._fetch_email_details(service, message['id'])
-                    if email_data:
-                        emails.append(email_data)
-                        
-                    # Progress update
-                    if (i + 1) % 10 == 0:
-                        print(f"Processed {i + 1}/{len(messages)} emails...")
-                        
-                except Exception as e:
-                    print(f"Error fetching email {message['id']}: {e}")
-                    continue
-            
-            print(f"Successfully fetched {len(emails)} emails from Gmail")
-            return emails
+            message_ids = [message['id'] for message in messages]
+            for start in range(0, len(message_ids), self.batch_size):
+                chunk = message_ids[start:start + self.batch_size]
+                emails.extend(self._fetch_batch(service, chunk))
+                
+                # Progress update
+                logger.debug("Processed %d/%d emails...", start + len(chunk), len(message_ids))
+            
+            logger.info("Successfully fetched %d emails from Gmail", len(emails))
+            with self._cache_lock:
+                self._cache[days_back] = (max_results, len(messages) < max_results, emails)
+            # Callers get their own dicts so edits can't leak into the cache
+            return [dict(email_data) for email_data in emails]
             
         except Exception as e:
-            print(f"Error fetching emails from Gmail: {e}")
+            logger.error("Error fetching emails from Gmail: %s", e)
             return []
     
+    def _get_cached(self, days_back: int, max_results: int) -> Optional[List[Dict]]:
+        """Return a cached fetch that covers this request, if any"""
+        with self._cache_lock:
+            entry = self._cache.get(days_back)
+        if entry is None:
+            return None
+        
+        cached_max, exhausted, emails = entry
+        if cached_max >= max_results or exhausted:
+            # Shallow copies - callers annotate emails, and cached ones are shared
+            return [dict(email_data) for email_data in emails[:max_results]]
+        return None
+    
+    def invalidate_cache(self):
+        """Drop cached fetches (e.g. after a sync brings in new mail)"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _fetch_batch(self, service, message_ids: List[str]) -> List[Dict]:
+        """
+        Fetch full messages with one batch HTTP request instead of one round
+        trip per message; falls back to per-message fetches if the batch fails
+        
+        Returns:
+            Parsed emails in the same order as message_ids
+        """
+        responses = {}
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.warning("Error fetching email %s: %s", request_id, exception)
+            else:
+                responses[request_id] = response
+        
+        try:
+            batch = service.new_batch_http_request(callback=on_response)
+            for message_id in message_ids:
+                batch.add(
+                    service.users().messages().get(userId='me', id=message_id, format='full'),
+                    request_id=message_id
+                )
+            batch.execute()
+        except Exception as e:
+            logger.warning("Batch fetch failed, fetching individually: %s", e)
+            return [email_data for email_data in
+                    (self._fetch_email_details(service, message_id) for message_id in message_ids)
+                    if email_data]
+        
+        emails = []
+        for message_id in message_ids:
+            message = responses.get(message_id)
+            if message is None:
+                continue
+            email_data = self._parse_message(message_id, message)
+            if email_data:
+                emails.append(email_data)
+        return emails
+    
     def _fetch_email_details(self, service, message_id: str) -> Optional[Dict]:
         """Fetch detailed email information"""
         try:
@@ -92,7 +193,15 @@ class GmailLiveFetcher:
                 id=message_id,
                 format='full'
             ).execute()
-            
+        except Exception as e:
+            logger.warning("Error fetching email %s: %s", message_id, e)
+            return None
+        
+        return self._parse_message(message_id, message)
+    
+    def _parse_message(self, message_id: str, message: Dict) -> Optional[Dict]:
+        """Build the email dictionary from a full-format Gmail message"""
+        try:
             # Extract headers
             headers = message['payload'].get('headers', [])
             header_dict = {h['name'].lower(): h['value'] for h in headers}
@@ -128,7 +237,7 @@ class GmailLiveFetcher:
             return email_data
             
         except Exception as e:
-            print(f"Error extracting email details: {e}")
+            logger.warning("Error extracting email details: %s", e)
             return None
     
     def _extract_body(self, payload) -> str:
@@ -163,7 +272,7 @@ class GmailLiveFetcher:
             return body.strip()
             
         except Exception as e:
-            print(f"Error extracting body: {e}")
+            logger.warning("Error extracting body: %s", e)
             return ""
     
     def _extract_email_from_sender(self, sender_str: str) -> str:
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+LLM Client - Shared OpenAI client for the intelligence layer
+Reuses one HTTP connection pool across all modules instead of one per instance
+"""
+
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Optional
+from openai import OpenAI
+from config import config
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+_client: Optional[OpenAI] = None
+_client_key_hash: Optional[str] = None
+_client_lock = threading.Lock()
+
+def get_openai_client() -> OpenAI:
+    """
+    Get the shared OpenAI client, creating it on first use
+
+    The client is rebuilt only if OPENAI_API_KEY changes (e.g. after
+    setup_api_key.py writes a new key into the environment).
+
+    Returns:
+        OpenAI client configured with the app's timeout and retry settings
+    """
+    global _client, _client_key_hash
+
+    key_hash = hashlib.blake2b(
+        os.getenv('OPENAI_API_KEY', '').encode(), digest_size=8
+    ).hexdigest()
+
+    with _client_lock:
+        if _client is None or _client_key_hash != key_hash:
+            _client = OpenAI(
+                timeout=config.OPENAI_TIMEOUT_SECONDS,
+                max_retries=config.OPENAI_MAX_RETRIES
+            )
+            _client_key_hash = key_hash
+        return _client
+
+def parse_json(text: str) -> Any:
+    """
+    Parse a JSON model response, using orjson when it is installed
+
+    Raises json.JSONDecodeError on invalid input either way
+    (orjson.JSONDecodeError subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -5,19 +5,51 @@ Production-ready email assistant API with MUI frontend support
 """
 
 import asyncio
+import functools
+import hashlib
 import json
+import logging
+import queue
 import time
-from datetime import datetime, timedelta
+import uuid
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from collections.abc import MutableMapping
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Query
+from fastapi import FastAPI, HTTPException, Query, Request, BackgroundTasks
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from cachetools import TTLCache, LRUCache
 import uvicorn
 
+logger = logging.getLogger(__name__)
+
+def _start_log_listener() -> Optional[QueueListener]:
+    """
+    Default logging for the server: handlers only enqueue records and a
+    background listener thread does the actual stdout writes, so request
+    handlers never block on the console. Leaves logging alone if the root
+    logger is already configured (uvicorn --log-config, pytest, ...).
+    """
+    if logging.getLogger().handlers:
+        return None
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener.start()
+    return listener
+
 # Import existing modules
 from email_database import EmailDatabase
 from complete_email_sync import CompleteEmailSync
@@ -37,12 +69,25 @@ except ImportError:
             pass
     CALENDAR_AVAILABLE = False
 
+# orjson serializes responses in Rust straight to bytes; fall back to the stdlib encoder
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as APIJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    APIJSONResponse = JSONResponse
+    ORJSON_AVAILABLE = False
+
 # Import new intelligence modules
 from thread_summarizer import ThreadSummarizer
 from task_detector import TaskDetector
 from calendar_extractor import CalendarExtractor
 from model_router import ModelRouter
 from smart_labeler import SmartLabeler
+from performance_optimizer import (
+    performance_optimizer, SemanticCache, canonicalize_text, simhash64, hamming_distance
+)
+from config import config
 
 # Response models
 class EmailListResponse(BaseModel):
@@ -76,18 +121,44 @@ class CalendarResponse(BaseModel):
     auto_reply: bool
     calendar_event: Optional[Dict[str, Any]]
 
+# Request bodies are read-only once parsed; unknown fields are dropped
 class SyncRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     hours_back: int = 24
     delta_sync: bool = True
 
 class LabelRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     email_ids: List[str]
 
 # Initialize FastAPI app
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the sync worker and cache warm-up with the server; release workers on shutdown"""
+    log_listener = _start_log_listener()
+    sync_jobs.add(asyncio.create_task(sync_worker()))
+    # Warm-up runs in the background so startup isn't delayed
+    warmup_jobs.add(asyncio.create_task(warm_email_cache()))
+    
+    yield
+    
+    for task in sync_jobs:
+        task.cancel()
+    # Don't wait on in-flight background jobs
+    request_pool.shutdown(wait=False)
+    background_pool.shutdown(wait=False)
+    if log_listener:
+        # Flushes queued records before the process exits
+        log_listener.stop()
+
 app = FastAPI(
     title="MailMaestro API",
     description="AI-powered email assistant with intelligence layer",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=APIJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for React frontend
@@ -97,8 +168,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Smart-Ready", "X-Cache"],
 )
 
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """GZip everything except streaming endpoints, where buffering in the compressor would stall events"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress JSON API responses and the HTML shell (small bodies aren't worth it)
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=500)
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed build assets - a name never changes content, so cache for a year"""
+    
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 # Initialize components
 db = EmailDatabase()
 email_sync = CompleteEmailSync()
@@ -122,12 +214,143 @@ task_detector = TaskDetector(model_router)
 calendar_extractor = CalendarExtractor(model_router)
 smart_labeler = SmartLabeler(model_router)
 
-# Background task tracking
-background_tasks_status = {}
+class TaskStatusStore(MutableMapping):
+    """
+    Background task statuses. Unfinished tasks are held until they finish, so
+    pollers never lose a running job; finished ones move to a bounded TTL cache
+    so long-running servers don't accumulate every task ever started.
+    """
+    
+    FINISHED = ("completed", "error")
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self._active: Dict[str, Dict] = {}
+        self._finished = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    def __getitem__(self, task_id: str) -> Dict:
+        if task_id in self._active:
+            return self._active[task_id]
+        return self._finished[task_id]
+    
+    def __setitem__(self, task_id: str, status: Dict):
+        if status.get("status") in self.FINISHED:
+            self._active.pop(task_id, None)
+            self._finished[task_id] = status
+        else:
+            self._finished.pop(task_id, None)
+            self._active[task_id] = status
+    
+    def __delitem__(self, task_id: str):
+        if task_id in self._active:
+            del self._active[task_id]
+        else:
+            del self._finished[task_id]
+    
+    def __iter__(self):
+        yield from list(self._active)
+        yield from list(self._finished)
+    
+    def __len__(self) -> int:
+        return len(self._active) + len(self._finished)
+
+# Background task tracking (smart replies, syncs, classify jobs)
+background_tasks_status = TaskStatusStore(maxsize=512, ttl=1800)
+
+# Fast replies are deterministic per Gmail message, so memoize them by email ID
+fast_replies_cache = LRUCache(maxsize=256)
+
+# Cap concurrent smart-path (LLM) generations across all requests
+smart_reply_semaphore = asyncio.Semaphore(4)
+smart_reply_jobs = set()
+# Completed smart replies keyed on (email_id, body hash) - survives task status
+# eviction and is dropped wholesale when a sync brings in new mail
+smart_reply_cache = TTLCache(maxsize=2000, ttl=600)
+# Secondary index sender_email -> recent (SimHash of canonical text, reply)
+# pairs so near-identical emails (re-quoted, re-spaced, forwarded) reuse a
+# reply; a lookup only scans the one sender's entries
+smart_reply_similar_cache = TTLCache(maxsize=500, ttl=600)
+SIMHASH_MAX_DISTANCE = 3
+SIMHASH_ENTRIES_PER_SENDER = 32
+# Embedding-similarity fallback for rephrased emails the SimHash index misses
+# (no-op unless sentence-transformers is installed)
+semantic_reply_cache = SemanticCache(
+    similarity_threshold=config.SEMANTIC_CACHE_THRESHOLD,
+    ttl=config.SEMANTIC_CACHE_TTL_SECONDS
+)
+# Smart replies started right after a sync for new mail that likely needs one
+SMART_REPLY_PREFETCH_LIMIT = 10
+# Set when a smart reply task finishes, so stream subscribers wake immediately
+smart_reply_events: Dict[str, asyncio.Event] = {}
+
+# Syncs run one at a time on a single worker fed by this queue
+SYNC_CHUNK_SIZE = 25
+sync_queue: asyncio.Queue = asyncio.Queue()
+queued_sync_task_id: Optional[str] = None
+sync_jobs = set()
+
+# Short-lived search results to absorb bursts of duplicate queries while typing
+search_cache = TTLCache(maxsize=128, ttl=2)
+# Lowercased subject/body/sender per Gmail message, built once instead of on
+# every search request (messages are immutable, so email ID is a safe key)
+search_haystacks = LRUCache(maxsize=1000)
+
+# Dashboard overview (with its ETag source) and label stats are re-read on
+# every page load/refresh; serve repeats within a few seconds from memory.
+# The locks make concurrent misses wait for one computation instead of racing.
+STATS_CACHE_TTL = 10
+dashboard_cache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+dashboard_lock = asyncio.Lock()
+label_stats_cache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+label_stats_lock = asyncio.Lock()
+STATS_CACHE_HEADERS = {"Cache-Control": f"private, max-age={STATS_CACHE_TTL}"}
+
+# Production React build, served by the catch-all route at the bottom
+frontend_path = Path("frontend/build")
+# Set once the catch-all is registered; the build can appear after import,
+# but serve_react_app only exists if it was there at startup
+react_build_served = False
+
+# Email cache warm-up state, reported by /api/health
+warmup_status: Dict[str, Any] = {"ready": False, "error": None}
+warmup_jobs = set()
+
+# Separate thread pools so long sync/classification jobs can't occupy every
+# worker that interactive requests (Gmail fetches, reply generation) need
+request_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='request')
+background_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='background')
+
+async def run_in_request_pool(func, *args, **kwargs):
+    """Run a blocking call for an interactive request off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(request_pool, functools.partial(func, *args, **kwargs))
+
+async def run_in_background_pool(func, *args, **kwargs):
+    """Run a long-running blocking job off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(background_pool, functools.partial(func, *args, **kwargs))
+
+def _json_bytes(payload: Any, sort_keys: bool = False) -> bytes:
+    """Serialize for hashing/streaming - orjson when available, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(payload, default=str, option=option)
+    return json.dumps(payload, sort_keys=sort_keys, default=str).encode()
+
+def _etag_response(request: Request, payload: Any, etag_source: bytes,
+                   headers: Optional[Dict[str, str]] = None) -> Response:
+    """Return payload as JSON with an ETag, or an empty 304 if the client already has it"""
+    etag = '"' + hashlib.blake2b(etag_source, digest_size=8).hexdigest() + '"'
+    response_headers = {"ETag": etag, "Cache-Control": "no-cache", **(headers or {})}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=response_headers)
+    return APIJSONResponse(jsonable_encoder(payload), headers=response_headers)
 
 @app.get("/")
-async def root():
-    """Root endpoint - serve React app"""
+async def root(request: Request):
+    """Root endpoint - serve React app when built, API info otherwise"""
+    if react_build_served:
+        return await serve_react_app("", request)
     return {"message": "MailMaestro API", "version": "2.0.0", "status": "running"}
 
 @app.get("/api/health")
@@ -139,12 +362,32 @@ async def health_check():
         "components": {
             "database": "connected",
             "email_sync": "ready",
-            "ai_models": "available"
-        }
+            "ai_models": "available",
+            "email_cache": "ready" if warmup_status["ready"] else "warming"
+        },
+        "ready": warmup_status["ready"]
     }
 
+# Probes for load balancers/orchestrators - tiny, uncached, no Gmail or LLM I/O
+@app.get("/healthz")
+async def healthz():
+    """Liveness probe"""
+    return {"ok": True}
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness probe - 503 until cache warm-up finishes, or if the sync worker has died"""
+    sync_worker_alive = any(not task.done() for task in sync_jobs)
+    if not warmup_status["ready"] or not sync_worker_alive:
+        raise HTTPException(status_code=503, detail={
+            "email_cache": "ready" if warmup_status["ready"] else "warming",
+            "sync_worker": "running" if sync_worker_alive else "stopped"
+        })
+    return {"ok": True}
+
 @app.get("/api/emails", response_model=EmailListResponse)
 async def get_emails(
+    request: Request,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     search: Optional[str] = None,
@@ -154,57 +397,78 @@ async def get_emails(
 ):
     """Get emails directly from Gmail for past 10 days"""
     try:
-        print(f"Fetching emails from Gmail - days: {days}, per_page: {per_page}")
-        
-        # Fetch emails directly from Gmail API
-        emails = gmail_fetcher.fetch_recent_emails(
-            days_back=days, 
-            max_results=per_page * 2  # Get more to handle pagination
-        )
-        
-        # Apply search filtering if provided
-        if search:
-            search_lower = search.lower()
-            emails = [email for email in emails 
-                     if search_lower in email.get('subject', '').lower() 
-                     or search_lower in email.get('body_text', '').lower()]
-        
-        # Apply sender filtering if provided
-        if sender:
-            sender_lower = sender.lower()
-            emails = [email for email in emails 
-                     if sender_lower in email.get('sender', '').lower() 
-                     or sender_lower in email.get('sender_email', '').lower()]
-        
-        # Sort by date (most recent first)
-        emails.sort(key=lambda x: x.get('date_received', ''), reverse=True)
-        
-        # Apply pagination
-        offset = (page - 1) * per_page
-        paginated_emails = emails[offset:offset + per_page]
-        has_more = len(emails) > offset + per_page
-        
-        print(f"Returning {len(paginated_emails)} emails from Gmail")
-        
-        return EmailListResponse(
-            emails=paginated_emails,
-            total_count=len(emails),
-            page=page,
-            per_page=per_page,
-            has_more=has_more
-        )
+        response, etag_source = await _list_emails(page, per_page, search, sender, days)
+        return _etag_response(request, response, etag_source)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching emails: {str(e)}")
 
+async def _list_emails(page: int, per_page: int, search: Optional[str],
+                       sender: Optional[str], days: int) -> tuple:
+    """
+    Fetch, filter and paginate recent Gmail messages
+    
+    Returns:
+        Tuple of (EmailListResponse, ETag source)
+    """
+    logger.debug("Fetching emails from Gmail - days: %s, per_page: %s", days, per_page)
+    
+    # Fetch emails directly from Gmail API
+    emails = await run_in_request_pool(
+        gmail_fetcher.fetch_recent_emails,
+        days_back=days, 
+        max_results=per_page * 2  # Get more to handle pagination
+    )
+    
+    # Apply search filtering if provided
+    if search:
+        search_lower = search.lower()
+        emails = [email for email in emails 
+                 if search_lower in email.get('subject', '').lower() 
+                 or search_lower in email.get('body_text', '').lower()]
+    
+    # Apply sender filtering if provided
+    if sender:
+        sender_lower = sender.lower()
+        emails = [email for email in emails 
+                 if sender_lower in email.get('sender', '').lower() 
+                 or sender_lower in email.get('sender_email', '').lower()]
+    
+    # Sort by date (most recent first)
+    emails.sort(key=lambda x: x.get('date_received', ''), reverse=True)
+    
+    # Apply pagination
+    offset = (page - 1) * per_page
+    paginated_emails = emails[offset:offset + per_page]
+    has_more = len(emails) > offset + per_page
+    
+    logger.debug("Returning %d emails from Gmail", len(paginated_emails))
+    
+    response = EmailListResponse(
+        emails=paginated_emails,
+        total_count=len(emails),
+        page=page,
+        per_page=per_page,
+        has_more=has_more
+    )
+    # Gmail message content is immutable per ID, so the page's IDs plus
+    # the mutable flags identify it without hashing every body
+    etag_source = _json_bytes([
+        page, per_page, len(emails), has_more,
+        [(e.get('id'), e.get('is_unread'), e.get('labels')) for e in paginated_emails]
+    ])
+    return response, etag_source
+
 @app.get("/api/threads/{thread_id}")
 async def get_thread(thread_id: str):
     """Get full thread with summary, tasks, and meeting info"""
     try:
-        print(f"DEBUG: Fetching thread {thread_id}")
+        logger.debug("Fetching thread %s", thread_id)
         
         # Get emails from Gmail and filter by thread_id
-        emails = gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
+        emails = await run_in_request_pool(
+            gmail_fetcher.fetch_recent_emails, days_back=30, max_results=200
+        )
         thread_emails = [email for email in emails if email.get('thread_id') == thread_id]
         
         if not thread_emails:
@@ -251,7 +515,7 @@ async def get_thread(thread_id: str):
                     'confidence': 0.8
                 }
         
-        print(f"DEBUG: Returning thread with {len(thread_emails)} emails")
+        logger.debug("Returning thread with %d emails", len(thread_emails))
         return {
             "thread_id": thread_id,
             "emails": thread_emails,
@@ -261,87 +525,237 @@ async def get_thread(thread_id: str):
         }
         
     except Exception as e:
-        print(f"Exception in get_thread: {e}")
+        logger.exception("Exception in get_thread: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching thread: {str(e)}")
 
 
+async def _get_email_by_id(email_id: str) -> Optional[Dict]:
+    """Look up a recent Gmail message without blocking the event loop"""
+    emails = await run_in_request_pool(
+        gmail_fetcher.fetch_recent_emails, days_back=30, max_results=200
+    )
+    return next((e for e in emails if e.get('id') == email_id), None)
+
+def _generate_fast_replies(email: Dict) -> List[Dict]:
+    """Run the synchronous fast-path generator for a single email"""
+    try:
+        email_data = {
+            'subject': email.get('subject', ''),
+            'body': email.get('body_text', ''),
+            'sender': email.get('sender', '')
+        }
+        classification = {'primary_label': email.get('primary_label', 'general')}
+        return response_generator.generate_fast_responses(email_data, classification)
+    except AttributeError:
+        # Fallback fast replies
+        return [
+            {'type': 'Professional', 'body': 'Thank you for your email. I will review this and get back to you soon.', 'confidence': 0.8},
+            {'type': 'Quick', 'body': 'Got it! I\'ll take care of this.', 'confidence': 0.7},
+            {'type': 'Friendly', 'body': 'Thanks for reaching out! I\'ll look into this.', 'confidence': 0.7}
+        ]
+
+def _smart_cache_key(email: Dict) -> tuple:
+    """Cache key for a smart reply - changes if the email body does"""
+    body_hash = hashlib.blake2b(
+        email.get('body_text', '').encode('utf-8'), digest_size=8
+    ).hexdigest()
+    return (email.get('id'), body_hash)
+
+def _smart_similarity_key(email: Dict) -> tuple:
+    """Near-duplicate key for a smart reply: sender plus a SimHash of canonical text"""
+    text = canonicalize_text(f"{email.get('subject', '')} {email.get('body_text', '')}")
+    return (email.get('sender_email', ''), simhash64(text))
+
+def _find_similar_smart_reply(email: Dict) -> Optional[Dict]:
+    """Return a cached smart reply for a near-identical email from the same sender"""
+    sender, fingerprint = _smart_similarity_key(email)
+    for cached_fingerprint, reply in smart_reply_similar_cache.get(sender, ()):
+        if hamming_distance(fingerprint, cached_fingerprint) <= SIMHASH_MAX_DISTANCE:
+            return reply
+    return None
+
+def _remember_similar_smart_reply(email: Dict, reply: Dict):
+    sender, fingerprint = _smart_similarity_key(email)
+    entries = smart_reply_similar_cache.get(sender)
+    if entries is None:
+        entries = deque(maxlen=SIMHASH_ENTRIES_PER_SENDER)
+    entries.append((fingerprint, reply))
+    # Re-set so the sender's TTL restarts with its newest reply
+    smart_reply_similar_cache[sender] = entries
+
+def _semantic_text(email: Dict) -> str:
+    return canonicalize_text(f"{email.get('subject', '')} {email.get('body_text', '')}")
+
+def _find_semantic_smart_reply(email: Dict) -> Optional[Dict]:
+    """Return a cached smart reply for a semantically similar email from the same sender"""
+    embedding = semantic_reply_cache.embed(_semantic_text(email))
+    return semantic_reply_cache.lookup(email.get('sender_email', ''), embedding)
+
+def _remember_semantic_smart_reply(email: Dict, reply: Dict):
+    semantic_reply_cache.add(
+        email.get('sender_email', ''), semantic_reply_cache.embed(_semantic_text(email)), reply
+    )
+
+def _persistent_smart_key(cache_key: tuple) -> str:
+    """Key for smart replies in the optimizer's persistent 'smart' cache layer"""
+    return performance_optimizer.cache_key('smart_reply', *cache_key)
+
+async def _start_smart_reply(email_id: str, email: Dict) -> tuple:
+    """
+    Start smart reply generation for an email unless one is already running or done
+    
+    Returns:
+        Tuple of (task_id, completed smart reply or None)
+    """
+    # One task per email - repeat requests reuse a running or completed task
+    task_id = f"smart_reply_{email_id}"
+    cache_key = _smart_cache_key(email)
+    cached = smart_reply_cache.get(cache_key)
+    if cached is None:
+        # Survives restarts/reloads via the optimizer's SQLite layer
+        cached = await run_in_request_pool(
+            performance_optimizer.get_from_cache, _persistent_smart_key(cache_key), 'smart'
+        )
+        if cached is None:
+            cached = _find_similar_smart_reply(email)
+        if cached is None and semantic_reply_cache.enabled:
+            cached = await run_in_request_pool(_find_semantic_smart_reply, email)
+        if cached is not None:
+            smart_reply_cache[cache_key] = cached
+    if cached is not None:
+        return task_id, cached
+    
+    existing = background_tasks_status.get(task_id)
+    if existing and existing["status"] == "completed":
+        return task_id, existing.get("result")
+    
+    if not existing or existing["status"] == "error":
+        background_tasks_status[task_id] = {"status": "pending"}
+        smart_reply_events[task_id] = asyncio.Event()
+        task = asyncio.create_task(generate_smart_reply_background(task_id, email))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        smart_reply_jobs.add(task)
+        task.add_done_callback(smart_reply_jobs.discard)
+    
+    return task_id, None
+
+async def _get_fast_replies(email_id: str, email: Dict) -> List[Dict]:
+    """Fast-path replies for an email, generated off the event loop and memoized"""
+    fast_replies = fast_replies_cache.get(email_id)
+    if fast_replies is None:
+        fast_replies = await run_in_request_pool(_generate_fast_replies, email)
+        fast_replies_cache[email_id] = fast_replies
+    return fast_replies
+
 @app.post("/api/reply_suggestions")
-async def generate_replies(
-    email_id: str,
-    background_tasks: BackgroundTasks
-):
+async def generate_replies(email_id: str, response: Response):
     """Generate AI reply suggestions (fast + smart paths)"""
     try:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Get email data from Gmail
-        emails = gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
-        email = next((e for e in emails if e.get('id') == email_id), None)
+        email = await _get_email_by_id(email_id)
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
         
-        # Generate fast replies (synchronous)
-        try:
-            email_data = {
-                'subject': email.get('subject', ''),
-                'body': email.get('body_text', ''),
-                'sender': email.get('sender', '')
-            }
-            classification = {'primary_label': email.get('primary_label', 'general')}
-            fast_replies = response_generator.generate_fast_responses(email_data, classification)
-        except AttributeError:
-            # Fallback fast replies
-            fast_replies = [
-                {'type': 'Professional', 'body': 'Thank you for your email. I will review this and get back to you soon.', 'confidence': 0.8},
-                {'type': 'Quick', 'body': 'Got it! I\'ll take care of this.', 'confidence': 0.7},
-                {'type': 'Friendly', 'body': 'Thanks for reaching out! I\'ll look into this.', 'confidence': 0.7}
-            ]
-        
-        # Start smart reply generation in background
-        task_id = f"smart_reply_{email_id}_{int(time.time())}"
-        background_tasks.add_task(
-            generate_smart_reply_background,
-            task_id,
-            email
+        # Smart-path cache lookup/kick-off and fast-path generation run
+        # concurrently, so neither waits on the other's blocking work; the LLM
+        # call itself continues in the background after we respond
+        (task_id, smart_reply), fast_replies = await asyncio.gather(
+            _start_smart_reply(email_id, email),
+            _get_fast_replies(email_id, email)
         )
         
-        generation_time = int((time.time() - start_time) * 1000)
+        generation_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+        # hit: the smart reply came from a cache (exact, near-duplicate or semantic)
+        response.headers["X-Cache"] = "hit" if smart_reply else "miss"
         
         return ReplyResponse(
             fast_replies=fast_replies,
-            smart_reply=None,  # Will be available via background task
-            generation_time_ms=generation_time
+            smart_reply=smart_reply,
+            generation_time_ms=generation_time,
+            smart_reply_task_id=None if smart_reply else task_id
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating replies: {str(e)}")
 
 @app.get("/api/reply_suggestions/{task_id}/smart")
-async def get_smart_reply(task_id: str):
-    """Get smart reply from background task"""
+async def get_smart_reply(task_id: str, request: Request):
+    """Get smart reply from background task (304 while nothing has changed)"""
+    task_status = background_tasks_status.get(task_id)
+    if task_status is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    # A task's payload only changes when its status does
+    status = task_status["status"]
+    return _etag_response(
+        request,
+        {
+            "status": status,
+            "result": task_status.get("result"),
+            "error": task_status.get("error")
+        },
+        f"{task_id}:{status}".encode(),
+        headers={"X-Smart-Ready": "1" if status == "completed" else "0"}
+    )
+
+@app.get("/api/reply_suggestions/{task_id}/stream")
+async def stream_smart_reply(task_id: str):
+    """Server-sent events for a smart reply task - pushes the result as soon as it's ready"""
     if task_id not in background_tasks_status:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task_status = background_tasks_status[task_id]
+    def to_event(task_status: Optional[Dict]) -> str:
+        if task_status is None:
+            task_status = {"status": "error", "error": "Task expired"}
+        payload = {
+            "status": task_status["status"],
+            "result": task_status.get("result"),
+            "error": task_status.get("error")
+        }
+        return f"data: {json.dumps(payload)}\n\n"
+    
+    async def event_stream():
+        task_status = background_tasks_status.get(task_id)
+        yield to_event(task_status)
+        
+        while task_status and task_status["status"] in ("pending", "running"):
+            done_event = smart_reply_events.get(task_id)
+            if done_event is None:
+                break
+            try:
+                await asyncio.wait_for(done_event.wait(), timeout=15)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            task_status = background_tasks_status.get(task_id)
+            yield to_event(task_status)
+            return
+        
+        # Finished between the first read and the wait
+        latest = background_tasks_status.get(task_id)
+        if latest is not task_status:
+            yield to_event(latest)
     
-    return {
-        "status": task_status["status"],
-        "result": task_status.get("result"),
-        "error": task_status.get("error")
-    }
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.post("/api/tasks/{email_id}", response_model=TaskResponse)
 async def extract_tasks(email_id: str):
     """Extract tasks from email"""
     try:
         # Get email data from Gmail
-        emails = gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
-        email = next((e for e in emails if e.get('id') == email_id), None)
+        email = await _get_email_by_id(email_id)
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
         
-        # Extract tasks
-        tasks = task_detector.extract_tasks(
+        # Extract tasks (pattern pass plus an LLM call) off the event loop
+        tasks = await run_in_request_pool(
+            task_detector.extract_tasks,
             email.get('body_text', ''),
             {
                 'sender': email.get('sender', ''),
@@ -366,13 +780,13 @@ async def calendar_autorespond(email_id: str):
     """Handle meeting invitations with auto-response proposal"""
     try:
         # Get email data from Gmail
-        emails = gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
-        email = next((e for e in emails if e.get('id') == email_id), None)
+        email = await _get_email_by_id(email_id)
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
         
-        # Extract meeting info
-        meeting_info = calendar_extractor.extract_meeting_info(
+        # Extract meeting info off the event loop
+        meeting_info = await run_in_request_pool(
+            calendar_extractor.extract_meeting_info,
             email.get('body_text', ''),
             {
                 'subject': email.get('subject', ''),
@@ -398,21 +812,26 @@ async def calendar_autorespond(email_id: str):
         raise HTTPException(status_code=500, detail=f"Error processing calendar request: {str(e)}")
 
 @app.post("/api/sync")
-async def sync_emails(
-    sync_request: SyncRequest,
-    background_tasks: BackgroundTasks
-):
+async def sync_emails(sync_request: SyncRequest):
     """Sync emails from Gmail with intelligence processing"""
+    global queued_sync_task_id
     try:
-        task_id = f"sync_{int(time.time())}"
-        
-        # Start sync in background
-        background_tasks.add_task(
-            sync_emails_background,
-            task_id,
-            sync_request.hours_back,
-            sync_request.delta_sync
-        )
+        # A sync that hasn't started yet will pick up the same mail - reuse it
+        if queued_sync_task_id:
+            return {
+                "task_id": queued_sync_task_id,
+                "status": "queued",
+                "message": "Email sync already queued"
+            }
+        
+        task_id = f"sync_{int(time.time() * 1000)}"
+        background_tasks_status[task_id] = {
+            "status": "queued",
+            "progress": 0,
+            "message": "Waiting for sync worker..."
+        }
+        queued_sync_task_id = task_id
+        await sync_queue.put((task_id, sync_request.hours_back, sync_request.delta_sync))
         
         return {
             "task_id": task_id,
@@ -431,130 +850,275 @@ async def get_sync_status(task_id: str):
     
     return background_tasks_status[task_id]
 
+async def _classify_email_ids(email_ids: List[str]) -> Dict[str, List[Dict]]:
+    """Fetch the requested emails and classify them off the event loop"""
+    emails = await run_in_request_pool(
+        gmail_fetcher.fetch_recent_emails, days_back=30, max_results=200
+    )
+    emails_by_id = {e.get('id'): e for e in emails}
+    selected = [emails_by_id[email_id] for email_id in email_ids
+                if email_id in emails_by_id]
+    
+    # Classify concurrently off the event loop
+    return await run_in_background_pool(smart_labeler.batch_classify_emails, selected)
+
 @app.post("/api/labels/classify", response_model=Dict[str, List[Dict]])
 async def classify_emails(label_request: LabelRequest):
     """Classify emails with smart labels"""
     try:
-        results = {}
-        
-        # Get emails from Gmail
-        emails = gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
-        
-        for email_id in label_request.email_ids:
-            email = next((e for e in emails if e.get('id') == email_id), None)
-            if email:
-                labels = smart_labeler.classify_email(email)
-                results[email_id] = labels
-        
-        return results
+        return await _classify_email_ids(label_request.email_ids)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error classifying emails: {str(e)}")
 
+@app.post("/api/labels/classify/jobs")
+async def start_classify_job(label_request: LabelRequest, background_tasks: BackgroundTasks):
+    """Queue classification and return a job id immediately instead of waiting on the LLM"""
+    task_id = f"classify_{uuid.uuid4().hex}"
+    background_tasks_status[task_id] = {"status": "queued"}
+    background_tasks.add_task(classify_emails_background, task_id, label_request.email_ids)
+    
+    return {"task_id": task_id, "status": "queued"}
+
+@app.get("/api/labels/classify/jobs/{task_id}")
+async def get_classify_job(task_id: str):
+    """Get classification job status (result included once completed)"""
+    if task_id not in background_tasks_status:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    return background_tasks_status[task_id]
+
 @app.get("/api/labels/stats")
-async def get_label_stats():
+async def get_label_stats(request: Request):
     """Get label statistics"""
     try:
-        stats = smart_labeler.get_label_statistics()
-        return stats
+        stats, etag_source = await _get_label_stats_cached()
+        return _etag_response(request, stats, etag_source, headers=STATS_CACHE_HEADERS)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting label stats: {str(e)}")
 
 @app.get("/api/dashboard/overview")
-async def get_dashboard_overview():
+async def get_dashboard_overview(request: Request):
     """Get dashboard overview data"""
     try:
-        # Get recent emails from Gmail
-        recent_emails = gmail_fetcher.fetch_recent_emails(days_back=7, max_results=50)
-        
-        # Calculate basic stats
-        db_stats = {
-            'total_emails': len(recent_emails),
-            'important_emails': len([e for e in recent_emails if e.get('is_important')]),
-            'needs_response': len([e for e in recent_emails if e.get('requires_response')]),
-            'total_responses': 0,
-            'calendar_events': 0
-        }
-        
-        # Get important emails
-        important_emails = [e for e in recent_emails if e.get('is_important')][:5]
-        
-        # Get label distribution
-        label_stats = smart_labeler.get_label_statistics()
-        
-        # Get model usage
-        model_usage = model_router.get_usage_report()
-        
-        return {
-            "email_stats": db_stats,
-            "recent_important": important_emails,
-            "label_distribution": label_stats.get("label_distribution", {}),
-            "model_usage": model_usage,
-            "last_updated": datetime.now().isoformat()
-        }
+        overview, etag_source = await _get_dashboard_overview_cached()
+        return _etag_response(request, overview, etag_source, headers=STATS_CACHE_HEADERS)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting dashboard data: {str(e)}")
 
+async def _get_label_stats_cached() -> tuple:
+    """Label statistics and their ETag source, recomputed at most every STATS_CACHE_TTL seconds"""
+    cached = label_stats_cache.get('stats')
+    if cached is None:
+        async with label_stats_lock:
+            cached = label_stats_cache.get('stats')
+            if cached is None:
+                stats = await run_in_request_pool(smart_labeler.get_label_statistics)
+                cached = (stats, _json_bytes(stats, sort_keys=True))
+                label_stats_cache['stats'] = cached
+    return cached
+
+async def _get_dashboard_overview_cached() -> tuple:
+    """Dashboard overview and its ETag source, recomputed at most every STATS_CACHE_TTL seconds"""
+    cached = dashboard_cache.get('overview')
+    if cached is None:
+        async with dashboard_lock:
+            cached = dashboard_cache.get('overview')
+            if cached is None:
+                cached = await _build_dashboard_overview()
+                dashboard_cache['overview'] = cached
+    return cached
+
+async def _build_dashboard_overview() -> tuple:
+    """
+    Compute the dashboard overview
+    
+    Returns:
+        Tuple of (overview payload, ETag source)
+    """
+    # Get recent emails from Gmail
+    recent_emails = await run_in_request_pool(
+        gmail_fetcher.fetch_recent_emails, days_back=7, max_results=50
+    )
+    
+    # Calculate basic stats
+    db_stats = {
+        'total_emails': len(recent_emails),
+        'important_emails': len([e for e in recent_emails if e.get('is_important')]),
+        'needs_response': len([e for e in recent_emails if e.get('requires_response')]),
+        'total_responses': 0,
+        'calendar_events': 0
+    }
+    
+    # Get important emails
+    important_emails = [e for e in recent_emails if e.get('is_important')][:5]
+    
+    # Get label distribution
+    label_stats = await run_in_request_pool(smart_labeler.get_label_statistics)
+    
+    # Get model usage
+    model_usage = model_router.get_usage_report()
+    
+    overview = {
+        "email_stats": db_stats,
+        "recent_important": important_emails,
+        "label_distribution": label_stats.get("label_distribution", {}),
+        "model_usage": model_usage
+    }
+    # ETag covers the data only, so polls that find nothing new get a 304
+    etag_source = _json_bytes(overview, sort_keys=True)
+    overview["last_updated"] = datetime.now().isoformat()
+    return overview, etag_source
+
 @app.get("/api/search")
 async def search_emails(
+    request: Request,
     q: str = Query(..., min_length=1),
     limit: int = Query(20, ge=1, le=100)
 ):
     """Full-text search emails"""
+    cache_key = (q, limit)
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return _etag_response(request, *cached)
+    
     try:
         # Get emails from Gmail and search
-        all_emails = gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
+        all_emails = await run_in_request_pool(
+            gmail_fetcher.fetch_recent_emails, days_back=30, max_results=200
+        )
         
-        # Simple search filtering
+        # Simple search filtering over precomputed haystacks, stopping at limit
         q_lower = q.lower()
         results = []
         for email in all_emails:
-            if (q_lower in email.get('subject', '').lower() or 
-                q_lower in email.get('body_text', '').lower() or 
-                q_lower in email.get('sender', '').lower()):
+            if q_lower in _search_haystack(email):
                 results.append(email)
-                
-        # Limit results
-        results = results[:limit]
+                if len(results) >= limit:
+                    break
         
-        # Enrich with labels (simplified)
-        for email in results:
-            email['labels'] = [email.get('primary_label', 'general')]
+        # Enrich with labels (simplified) - on copies, not the fetcher's emails
+        results = [{**email, 'labels': [email.get('primary_label', 'general')]}
+                   for email in results]
         
-        return {
+        response = {
             "query": q,
             "results": results,
             "count": len(results)
         }
+        etag_source = _json_bytes(response, sort_keys=True)
+        search_cache[cache_key] = (response, etag_source)
+        return _etag_response(request, response, etag_source)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching emails: {str(e)}")
 
+def _search_haystack(email: Dict) -> str:
+    """Lowercased searchable text for an email, computed once per message"""
+    email_id = email.get('id')
+    haystack = search_haystacks.get(email_id) if email_id else None
+    if haystack is None:
+        # NUL separators keep a query from matching across field boundaries
+        haystack = '\0'.join((
+            email.get('subject', ''),
+            email.get('body_text', ''),
+            email.get('sender', '')
+        )).lower()
+        if email_id:
+            search_haystacks[email_id] = haystack
+    return haystack
+
 # Background task functions
 async def generate_smart_reply_background(task_id: str, email: Dict):
     """Generate smart reply in background"""
     try:
-        background_tasks_status[task_id] = {"status": "running"}
-        
-        # Use advanced response generation
-        smart_reply = await response_generator.generate_smart_response(
-            email.get('body_text', ''),
-            email.get('subject', ''),
-            email.get('sender', ''),
-            context=email
-        )
+        async with smart_reply_semaphore:
+            background_tasks_status[task_id] = {"status": "running"}
+            
+            # Use advanced response generation
+            smart_reply = await response_generator.generate_smart_response(
+                email.get('body_text', ''),
+                email.get('subject', ''),
+                email.get('sender', ''),
+                context=email
+            )
         
         background_tasks_status[task_id] = {
             "status": "completed",
             "result": smart_reply
         }
+        if smart_reply:
+            cache_key = _smart_cache_key(email)
+            smart_reply_cache[cache_key] = smart_reply
+            _remember_similar_smart_reply(email, smart_reply)
+            await run_in_background_pool(
+                performance_optimizer.set_in_cache,
+                _persistent_smart_key(cache_key), smart_reply, 'smart', 3600
+            )
+            if semantic_reply_cache.enabled:
+                await run_in_background_pool(_remember_semantic_smart_reply, email, smart_reply)
         
     except Exception as e:
         background_tasks_status[task_id] = {
             "status": "error",
             "error": str(e)
         }
+    finally:
+        done_event = smart_reply_events.pop(task_id, None)
+        if done_event:
+            done_event.set()
+
+async def classify_emails_background(task_id: str, email_ids: List[str]):
+    """Run a queued classification job and record its result"""
+    background_tasks_status[task_id] = {"status": "running"}
+    try:
+        result = await _classify_email_ids(email_ids)
+        background_tasks_status[task_id] = {
+            "status": "completed",
+            "result": result
+        }
+    except Exception as e:
+        logger.exception("Classification job %s failed", task_id)
+        background_tasks_status[task_id] = {
+            "status": "error",
+            "error": str(e)
+        }
+
+async def sync_worker():
+    """Single long-lived worker that runs queued syncs one at a time"""
+    global queued_sync_task_id
+    while True:
+        task_id, hours_back, delta_sync = await sync_queue.get()
+        if queued_sync_task_id == task_id:
+            queued_sync_task_id = None
+        try:
+            await sync_emails_background(task_id, hours_back, delta_sync)
+        except Exception:
+            logger.exception("Sync worker failed on %s", task_id)
+        finally:
+            sync_queue.task_done()
+
+def _warm_email_cache():
+    """Fetch the listings most endpoints read so the first real request hits the cache"""
+    gmail_fetcher.fetch_recent_emails(days_back=30, max_results=200)
+    gmail_fetcher.fetch_recent_emails(days_back=7, max_results=50)
+    # Load the embedding model now rather than on the first reply lookup
+    if semantic_reply_cache.enabled:
+        semantic_reply_cache.embed("")
+
+async def warm_email_cache():
+    """Warm Gmail caches in the background; the server accepts requests meanwhile"""
+    started = time.perf_counter_ns()
+    try:
+        await run_in_background_pool(_warm_email_cache)
+        logger.info("Email cache warmed in %.0fms", (time.perf_counter_ns() - started) / 1e6)
+    except Exception as e:
+        warmup_status["error"] = str(e)
+        logger.warning("Email cache warm-up failed: %s", e)
+    finally:
+        # Ready either way - a failed warm-up just means the first request fetches
+        warmup_status["ready"] = True
 
 async def sync_emails_background(task_id: str, hours_back: int, delta_sync: bool):
     """Sync emails in background with intelligence processing"""
@@ -565,10 +1129,10 @@ async def sync_emails_background(task_id: str, hours_back: int, delta_sync: bool
             "message": "Starting email sync..."
         }
         
-        # Sync emails  
+        # Sync emails (blocking Gmail/SQLite work runs off the event loop)
         try:
             # Try the new method first
-            sync_results = email_sync.sync_recent_emails(hours_back)
+            sync_results = await run_in_background_pool(email_sync.sync_recent_emails, hours_back)
         except AttributeError:
             # Fallback to existing method
             sync_results = {'new_emails': [], 'sync_time': 0}
@@ -578,25 +1142,35 @@ async def sync_emails_background(task_id: str, hours_back: int, delta_sync: bool
             "message": "Processing with AI intelligence..."
         })
         
-        # Process new emails with intelligence layer
+        # Process new emails with intelligence layer, in chunks so progress is
+        # reported as work completes
         new_emails = sync_results.get('new_emails', [])
         processed_count = 0
         
-        for email in new_emails:
-            # Classify with smart labels
-            smart_labeler.classify_email(email)
-            
-            # Generate thread summary if needed
-            thread_id = email.get('thread_id')
-            if thread_id:
-                thread_emails = [email]  # In real implementation, get full thread
-                thread_summarizer.summarize_thread(thread_id, thread_emails)
-            
-            processed_count += 1
+        for start in range(0, len(new_emails), SYNC_CHUNK_SIZE):
+            chunk = new_emails[start:start + SYNC_CHUNK_SIZE]
+            await run_in_background_pool(_process_synced_emails, chunk)
+            processed_count += len(chunk)
             
             # Update progress
             progress = 50 + (processed_count / len(new_emails)) * 50
-            background_tasks_status[task_id]["progress"] = int(progress)
+            background_tasks_status[task_id].update({
+                "progress": int(progress),
+                "message": f"Processed {processed_count}/{len(new_emails)} emails..."
+            })
+        
+        # New mail may have arrived - don't serve stale cached listings or replies
+        gmail_fetcher.invalidate_cache()
+        smart_reply_cache.clear()
+        smart_reply_similar_cache.clear()
+        semantic_reply_cache.clear()
+        search_haystacks.clear()
+        dashboard_cache.clear()
+        label_stats_cache.clear()
+        
+        # Get replies generating for new mail that needs an answer before the
+        # user opens it; the semaphore still caps concurrent LLM calls
+        await _prefetch_smart_replies(new_emails)
         
         background_tasks_status[task_id] = {
             "status": "completed",
@@ -616,28 +1190,101 @@ async def sync_emails_background(task_id: str, hours_back: int, delta_sync: bool
             "message": f"Sync failed: {str(e)}"
         }
 
+async def _prefetch_smart_replies(emails: List[Dict]):
+    """Start smart reply generation for the newest emails flagged important or needing a response"""
+    candidates = [e for e in emails
+                  if e.get('id') and (e.get('requires_response') or e.get('is_important'))]
+    await asyncio.gather(
+        *(_start_smart_reply(e['id'], e) for e in candidates[:SMART_REPLY_PREFETCH_LIMIT]),
+        return_exceptions=True
+    )
+
+def _process_synced_emails(emails: List[Dict]):
+    """Label and summarize a chunk of newly synced emails"""
+    for email in emails:
+        # Classify with smart labels
+        smart_labeler.classify_email(email)
+        
+        # Generate thread summary if needed
+        thread_id = email.get('thread_id')
+        if thread_id:
+            thread_emails = [email]  # In real implementation, get full thread
+            thread_summarizer.summarize_thread(thread_id, thread_emails)
+
 # Serve React app (when built)
-frontend_path = Path("frontend/build")
 if frontend_path.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_path / "static")), name="static")
+    app.mount("/static", ImmutableStaticFiles(directory=str(frontend_path / "static")), name="static")
+    # Top-level build files (favicon, manifest.json, ...) - StaticFiles sends
+    # ETag/Last-Modified, answers conditional requests with 304 and refuses
+    # paths that escape the build directory
+    build_files = StaticFiles(directory=str(frontend_path))
+    
+    def _build_preload_header() -> Optional[str]:
+        """Build a Link preload header for the entry CSS/JS from the CRA asset manifest"""
+        try:
+            manifest = json.loads((frontend_path / "asset-manifest.json").read_text())
+        except (OSError, ValueError):
+            return None
+        
+        links = []
+        for entry in manifest.get("entrypoints", []):
+            if entry.endswith(".css"):
+                links.append(f"</{entry}>; rel=preload; as=style")
+            elif entry.endswith(".js"):
+                links.append(f"</{entry}>; rel=preload; as=script")
+        return ", ".join(links) or None
+    
+    # The build is static, so read and fingerprint the shell and compute
+    # preload hints once at startup (GZipMiddleware handles compression)
+    index_html = (frontend_path / "index.html").read_bytes()
+    index_etag = '"' + hashlib.blake2b(index_html, digest_size=8).hexdigest() + '"'
+    # no-cache: the shell must revalidate so new hashed bundles are picked up
+    index_headers = {"ETag": index_etag, "Cache-Control": "no-cache"}
+    preload_header = _build_preload_header()
+    if preload_header:
+        index_headers["Link"] = preload_header
     
     @app.get("/{path:path}")
-    async def serve_react_app(path: str):
+    async def serve_react_app(path: str, request: Request):
         """Serve React app for all non-API routes"""
         if path.startswith("api/"):
             raise HTTPException(status_code=404)
         
-        file_path = frontend_path / path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        else:
-            return FileResponse(frontend_path / "index.html")
+        if path:
+            try:
+                return await build_files.get_response(path, request.scope)
+            except StarletteHTTPException:
+                pass  # Not a build file - client-side route, serve the shell
+        
+        if request.headers.get("if-none-match") == index_etag:
+            return Response(status_code=304, headers=index_headers)
+        return Response(content=index_html, media_type="text/html", headers=index_headers)
+    
+    react_build_served = True
 
 if __name__ == "__main__":
+    # uvloop/httptools come with uvicorn[standard]; fall back to the pure-Python
+    # stack when they aren't installed
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop_impl, http_impl = "uvloop", "httptools"
+    except ImportError:
+        loop_impl, http_impl = "asyncio", "h11"
+    
+    # Single worker process: task status, caches and the sync queue live in
+    # this process's memory, and uvicorn's workers share one socket, so
+    # polls would land on workers that never saw the task
     uvicorn.run(
         "mailmaestro_api:app",
         host="127.0.0.1",
         port=8000,
         reload=True,
+        loop=loop_impl,
+        http=http_impl,
+        # Per-request access lines are synchronous writes we don't need
+        access_log=False,
+        # Keep idle proxy connections around long enough to be reused
+        timeout_keep_alive=30,
         log_level="info"
     )
\ No newline at end of file
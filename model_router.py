@@ -104,6 +104,7 @@ class ModelRouter:
         
         # Track usage for cost monitoring
         self.usage_stats = {
+            "total_requests": 0,
             "total_tokens": 0,
             "total_cost": 0.0,
             "requests_by_model": {},
@@ -204,7 +205,8 @@ class ModelRouter:
         """Track model usage for cost monitoring"""
         model_name = model.value
         
-        # Update stats
+        # Update stats (running totals so reports don't rescan per-model entries)
+        self.usage_stats["total_requests"] += 1
         self.usage_stats["total_tokens"] += estimated_tokens
         
         if model_name not in self.usage_stats["requests_by_model"]:
@@ -227,18 +229,15 @@ class ModelRouter:
     def get_usage_report(self) -> Dict:
         """Get detailed usage and cost report"""
         session_duration = time.time() - self.usage_stats["session_start"]
+        total_requests = self.usage_stats["total_requests"]
         
         return {
             "session_duration_minutes": session_duration / 60,
-            "total_requests": sum(
-                stats["count"] for stats in self.usage_stats["requests_by_model"].values()
-            ),
+            "total_requests": total_requests,
             "total_tokens": self.usage_stats["total_tokens"],
             "total_cost_usd": round(self.usage_stats["total_cost"], 4),
             "cost_per_request": round(
-                self.usage_stats["total_cost"] / max(1, sum(
-                    stats["count"] for stats in self.usage_stats["requests_by_model"].values()
-                )), 4
+                self.usage_stats["total_cost"] / max(1, total_requests), 4
             ),
             "models_used": self.usage_stats["requests_by_model"]
         }
@@ -5,11 +5,15 @@ Achieves target performance: <100ms instant, <800ms smart, <200ms search
 """
 
 import asyncio
+import re
 import time
 import json
 import hashlib
+import logging
+import statistics
+from collections import deque
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from functools import wraps
 import sqlite3
 import threading
@@ -21,9 +25,20 @@ except ImportError:
     REDIS_AVAILABLE = False
     redis = None
 
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    np = None
+    SentenceTransformer = None
+
 from cachetools import TTLCache, LRUCache
 import pickle
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata"""
@@ -38,6 +53,117 @@ class CacheEntry:
     def access(self):
         self.access_count += 1
 
+_QUOTED_LINE_RE = re.compile(r'^\s*>.*$', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def canonicalize_text(text: str, max_chars: int = 512) -> str:
+    """Normalize email text for near-duplicate matching (case, quoted replies, whitespace)"""
+    text = _QUOTED_LINE_RE.sub('', text.lower())
+    return _WHITESPACE_RE.sub(' ', text).strip()[:max_chars]
+
+def simhash64(text: str) -> int:
+    """64-bit SimHash over word 3-shingles - similar texts differ in few bits"""
+    words = text.split()
+    shingles = [' '.join(words[i:i + 3]) for i in range(max(1, len(words) - 2))]
+    
+    weights = [0] * 64
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints"""
+    return bin(a ^ b).count('1')
+
+class SemanticCache:
+    """
+    Embedding-similarity cache: a lookup returns the value stored for the most
+    similar earlier text if its cosine similarity clears the threshold.
+    Entries are bucketed by scope (e.g. sender) and expire after ttl seconds.
+    Disabled (always misses) when sentence-transformers isn't installed.
+    """
+    
+    def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2',
+                 similarity_threshold: float = 0.92, ttl: float = 3600,
+                 max_scopes: int = 500, max_entries_per_scope: int = 50):
+        self.model_name = model_name
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries_per_scope = max_entries_per_scope
+        self.enabled = SENTENCE_TRANSFORMERS_AVAILABLE
+        self._model = None
+        self._lock = threading.RLock()
+        # scope -> (embedding matrix N x d, values, insertion timestamps)
+        self._buckets = LRUCache(maxsize=max_scopes)
+    
+    def _get_model(self):
+        """Load the embedding model on first use"""
+        with self._lock:
+            if self._model is None and self.enabled:
+                try:
+                    self._model = SentenceTransformer(self.model_name)
+                    logger.info("Semantic cache loaded embedding model %s", self.model_name)
+                except Exception as e:
+                    logger.warning("Semantic cache disabled, could not load %s: %s", self.model_name, e)
+                    self.enabled = False
+            return self._model
+    
+    def embed(self, text: str):
+        """Unit-length embedding for text, or None when the cache is disabled"""
+        model = self._get_model()
+        if model is None:
+            return None
+        return model.encode(text, normalize_embeddings=True)
+    
+    def lookup(self, scope: str, embedding) -> Optional[Any]:
+        """Return the value of the closest live entry in scope, if similar enough"""
+        if embedding is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(scope)
+            if bucket is None:
+                return None
+            matrix, values, timestamps = bucket
+            
+            live = [i for i, ts in enumerate(timestamps) if time.time() - ts < self.ttl]
+            if not live:
+                del self._buckets[scope]
+                return None
+            if len(live) < len(values):
+                matrix = matrix[live]
+                values = [values[i] for i in live]
+                timestamps = [timestamps[i] for i in live]
+                self._buckets[scope] = (matrix, values, timestamps)
+            
+            # Embeddings are normalized, so the dot product is cosine similarity
+            similarities = matrix @ embedding
+            best = int(similarities.argmax())
+            if similarities[best] >= self.similarity_threshold:
+                return values[best]
+        return None
+    
+    def add(self, scope: str, embedding, value: Any):
+        """Store value under embedding in scope, dropping the oldest entry when full"""
+        if embedding is None:
+            return
+        with self._lock:
+            bucket = self._buckets.get(scope)
+            if bucket is None:
+                self._buckets[scope] = (embedding[np.newaxis, :], [value], [time.time()])
+                return
+            matrix, values, timestamps = bucket
+            matrix = np.vstack([matrix, embedding])[-self.max_entries_per_scope:]
+            values = (values + [value])[-self.max_entries_per_scope:]
+            timestamps = (timestamps + [time.time()])[-self.max_entries_per_scope:]
+            self._buckets[scope] = (matrix, values, timestamps)
+    
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
 class PerformanceOptimizer:
     """Multi-layer caching and performance optimization system"""
     
@@ -77,6 +203,11 @@ class PerformanceOptimizer:
             'total_requests': 0
         }
         
+        # Fixed-size window of recent response times with a running sum,
+        # so recent averages and percentiles are O(1) to maintain
+        self.latency_window = deque(maxlen=128)
+        self.latency_window_sum = 0.0
+        
         # Lock for thread safety
         self.cache_lock = threading.RLock()
     
@@ -107,7 +238,7 @@ class PerformanceOptimizer:
             'kwargs': sorted(kwargs.items())
         }
         key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return hashlib.blake2b(key_str.encode('utf-8', 'ignore'), digest_size=16).hexdigest()
     
     def get_from_cache(self, key: str, cache_type: str = 'default') -> Optional[Any]:
         """Get item from appropriate cache layer"""
@@ -225,6 +356,19 @@ class PerformanceOptimizer:
         except Exception:
             pass
     
+    def record_response_time(self, execution_time: float):
+        """Record a response time (seconds) in the lifetime and recent-window metrics"""
+        with self.cache_lock:
+            self.metrics['total_requests'] += 1
+            self.metrics['avg_response_time'] += (
+                (execution_time - self.metrics['avg_response_time']) / self.metrics['total_requests']
+            )
+            
+            if len(self.latency_window) == self.latency_window.maxlen:
+                self.latency_window_sum -= self.latency_window[0]
+            self.latency_window.append(execution_time)
+            self.latency_window_sum += execution_time
+    
     def cached(self, cache_type: str = 'default', ttl: float = 3600):
         """Decorator for caching function results"""
         def decorator(func: Callable):
@@ -239,16 +383,12 @@ class PerformanceOptimizer:
                     return cached_result
                 
                 # Execute function and cache result
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 # Update metrics
-                self.metrics['total_requests'] += 1
-                self.metrics['avg_response_time'] = (
-                    (self.metrics['avg_response_time'] * (self.metrics['total_requests'] - 1) + execution_time) 
-                    / self.metrics['total_requests']
-                )
+                self.record_response_time(execution_time)
                 
                 # Cache the result
                 self.set_in_cache(key, result, cache_type, ttl)
@@ -266,16 +406,12 @@ class PerformanceOptimizer:
                     return cached_result
                 
                 # Execute function and cache result
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 result = await func(*args, **kwargs)
-                execution_time = time.time() - start_time
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 # Update metrics
-                self.metrics['total_requests'] += 1
-                self.metrics['avg_response_time'] = (
-                    (self.metrics['avg_response_time'] * (self.metrics['total_requests'] - 1) + execution_time) 
-                    / self.metrics['total_requests']
-                )
+                self.record_response_time(execution_time)
                 
                 # Cache the result
                 self.set_in_cache(key, result, cache_type, ttl)
@@ -518,6 +654,15 @@ class PerformanceOptimizer:
                 'task_cache': len(self.task_cache)
             }
             
+            # Recent-window latency stats (ms)
+            window_size = len(self.latency_window)
+            recent_avg = (self.latency_window_sum / window_size * 1000) if window_size else 0.0
+            if window_size >= 2:
+                percentiles = statistics.quantiles(self.latency_window, n=20, method='inclusive')
+                p50, p95 = percentiles[9] * 1000, percentiles[18] * 1000
+            else:
+                p50 = p95 = recent_avg
+            
             # SQLite cache size
             try:
                 conn = sqlite3.connect(self.sqlite_cache_path)
@@ -531,6 +676,12 @@ class PerformanceOptimizer:
                 'cache_hit_rate': round(hit_rate, 2),
                 'total_requests': self.metrics['total_requests'],
                 'average_response_time': round(self.metrics['avg_response_time'] * 1000, 2),  # ms
+                'recent_response_time': {
+                    'window': window_size,
+                    'avg_ms': round(recent_avg, 2),
+                    'p50_ms': round(p50, 2),
+                    'p95_ms': round(p95, 2)
+                },
                 'cache_sizes': cache_sizes,
                 'sqlite_cache_size': sqlite_cache_size,
                 'redis_available': self.redis_client is not None
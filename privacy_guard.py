@@ -28,6 +28,30 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Lookup tables built once at import instead of on every detection
+PII_REPLACEMENTS = {
+    'email': '[EMAIL_REDACTED]',
+    'phone': '[PHONE_REDACTED]',
+    'ssn': '[SSN_REDACTED]',
+    'credit_card': '[CARD_REDACTED]',
+    'person': '[NAME_REDACTED]',
+    'address': '[ADDRESS_REDACTED]',
+    'organization': '[ORG_REDACTED]',
+    'date_of_birth': '[DOB_REDACTED]',
+    'sensitive_data': '[SENSITIVE_REDACTED]'
+}
+
+# PII types that get a hash suffix so the same value redacts consistently
+HASHED_PII_TYPES = frozenset({'person', 'email', 'organization'})
+
+NER_LABEL_MAP = {
+    'PER': 'person',
+    'PERSON': 'person',
+    'ORG': 'organization',
+    'LOC': 'location',
+    'MISC': 'miscellaneous'
+}
+
 @dataclass
 class PIIDetection:
     """Detected PII information"""
@@ -294,36 +318,18 @@ class PrivacyGuard:
     
     def _map_ner_label(self, label: str) -> Optional[str]:
         """Map NER labels to our PII types"""
-        mapping = {
-            'PER': 'person',
-            'PERSON': 'person',
-            'ORG': 'organization',
-            'LOC': 'location',
-            'MISC': 'miscellaneous'
-        }
-        return mapping.get(label.upper())
+        return NER_LABEL_MAP.get(label.upper())
     
     def _generate_replacement(self, pii_type: str, original_text: str) -> str:
         """Generate appropriate replacement text for PII"""
-        replacements = {
-            'email': '[EMAIL_REDACTED]',
-            'phone': '[PHONE_REDACTED]',
-            'ssn': '[SSN_REDACTED]',
-            'credit_card': '[CARD_REDACTED]',
-            'person': '[NAME_REDACTED]',
-            'address': '[ADDRESS_REDACTED]',
-            'organization': '[ORG_REDACTED]',
-            'date_of_birth': '[DOB_REDACTED]',
-            'sensitive_data': '[SENSITIVE_REDACTED]'
-        }
+        base_replacement = PII_REPLACEMENTS.get(pii_type, '[REDACTED]')
         
         # Create a hash-based consistent replacement for some types
-        if pii_type in ['person', 'email', 'organization']:
+        if pii_type in HASHED_PII_TYPES:
             hash_suffix = hashlib.md5(original_text.encode()).hexdigest()[:4].upper()
-            base_replacement = replacements.get(pii_type, '[REDACTED]')
             return f"{base_replacement}_{hash_suffix}"
         
-        return replacements.get(pii_type, '[REDACTED]')
+        return base_replacement
     
     def _filter_and_deduplicate(self, detections: List[PIIDetection], 
                                threshold: float) -> List[PIIDetection]:
@@ -362,19 +368,21 @@ class PrivacyGuard:
         if detections is None:
             detections = self.detect_pii(text)
         
-        # Sort detections by start position (reverse order for replacement)
-        detections_sorted = sorted(detections, key=lambda x: x.start, reverse=True)
+        # Build the output in a single forward pass instead of re-slicing the
+        # whole string once per detection
+        parts = []
+        cursor = 0
         
-        redacted_text = text
+        for detection in sorted(detections, key=lambda x: x.start):
+            if detection.start < cursor:
+                continue  # Overlaps a span that was already redacted
+            parts.append(text[cursor:detection.start])
+            parts.append(detection.replacement)
+            cursor = detection.end
         
-        for detection in detections_sorted:
-            redacted_text = (
-                redacted_text[:detection.start] +
-                detection.replacement +
-                redacted_text[detection.end:]
-            )
+        parts.append(text[cursor:])
         
-        return redacted_text, detections
+        return ''.join(parts), detections
     
     def encrypt_sensitive_data(self, data: str) -> str:
         """Encrypt sensitive data"""
@@ -5,18 +5,29 @@ Part of MailMaestro-level intelligence layer
 """
 
 import json
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Set, Optional
-from openai import OpenAI
+from llm_client import get_openai_client, parse_json
 import sqlite3
 from config import config
 
+logger = logging.getLogger(__name__)
+
+# Classification instructions, identical on every call; the label list is
+# appended once per labeler (see __init__) and only the email goes in the user turn
+CLASSIFY_SYSTEM_PROMPT = """You are an expert email classifier. Always respond with valid JSON.
+Label the email. Reply with ONLY a JSON array (no markdown).
+Item: {"label":str,"confidence":0-1}
+Rules: labels from LABELS only; include only confidence >= 0.5; multiple allowed; no extra keys or commentary; [] if none.
+LABELS: """
+
 class SmartLabeler:
     """Multi-label email classifier with pattern recognition and ML"""
     
     def __init__(self, model_router=None):
-        self.client = OpenAI()
         self.model_router = model_router
         self.db_path = "secure_emails.db"
         
@@ -74,8 +85,17 @@ class SmartLabeler:
             }
         }
         
+        # Label set is fixed per instance, so the full system prompt is too
+        label_names = [name for name in self.label_categories.keys() if name != "general"]
+        self._llm_system_prompt = CLASSIFY_SYSTEM_PROMPT + '|'.join(label_names)
+        
         self._initialize_label_storage()
     
+    @property
+    def client(self):
+        """Shared OpenAI client - fetched per call so a rotated API key is picked up"""
+        return get_openai_client()
+    
     def _initialize_label_storage(self):
         """Initialize database table for storing email labels"""
         try:
@@ -101,7 +121,7 @@ class SmartLabeler:
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"Error initializing label storage: {e}")
+            logger.warning("Error initializing label storage: %s", e)
     
     def classify_email(self, email_data: Dict) -> List[Dict]:
         """
@@ -119,14 +139,17 @@ class SmartLabeler:
             body = email_data.get('body', '')
             sender = email_data.get('sender', '')
             
-            # Combine text for analysis
+            # Combine text for analysis - subject plus the opening and closing of
+            # the body (asks and unsubscribe footers live at the end)
+            if len(body) > 1000:
+                body = f"{body[:800]} {body[-200:]}"
             full_text = f"{subject} {body}".lower()
             
             # Pattern-based classification (fast)
             pattern_labels = self._classify_by_patterns(full_text, sender)
             
             # LLM-based classification (comprehensive)
-            llm_labels = self._classify_by_llm(email_data)
+            llm_labels = self._classify_by_llm(email_data, pattern_labels)
             
             # Merge and rank labels
             final_labels = self._merge_classifications(pattern_labels, llm_labels)
@@ -137,7 +160,7 @@ class SmartLabeler:
             return final_labels
             
         except Exception as e:
-            print(f"Error classifying email: {e}")
+            logger.warning("Error classifying email: %s", e)
             return [{"label": "general", "confidence": 0.5, "source": "fallback"}]
     
     def _classify_by_patterns(self, text: str, sender: str) -> List[Dict]:
@@ -173,11 +196,15 @@ class SmartLabeler:
         
         return labels
     
-    def _classify_by_llm(self, email_data: Dict) -> List[Dict]:
+    def _classify_by_llm(self, email_data: Dict, pattern_labels: List[Dict] = None) -> List[Dict]:
         """LLM-based comprehensive classification"""
         try:
             subject = email_data.get('subject', '')
-            body = email_data.get('body', '')[:2000]  # Limit for cost
+            # Patterns already found strong signals - a short excerpt is enough
+            # for the model to confirm them, so don't pay for the whole body
+            strong_hits = [l for l in (pattern_labels or []) if l["confidence"] >= 0.75]
+            body_limit = 500 if len(strong_hits) >= 2 else 2000  # Limit for cost
+            body = email_data.get('body', '')[:body_limit]
             sender = email_data.get('sender', '')
             
             # Choose model
@@ -185,36 +212,16 @@ class SmartLabeler:
             if self.model_router:
                 model = self.model_router.choose_model("classify")
             
-            # Available labels
-            label_names = [name for name in self.label_categories.keys() if name != "general"]
-            
-            prompt = f"""Classify this email with appropriate labels. Return ONLY valid JSON array.
-
-From: {sender}
-Subject: {subject}
-
-Body:
-{body}
-
-Available labels: {', '.join(label_names)}
-
-Classify with confidence scores. Return format:
-[
-  {{"label": "meeting", "confidence": 0.9}},
-  {{"label": "urgent", "confidence": 0.7}}
-]
-
-Rules:
-- Only use labels from the available list
-- Confidence: 0.0-1.0 (only include if >= 0.5)
-- Multiple labels are allowed
-- Return empty array [] if no strong matches
-- Must be valid JSON"""
+            # Compact, delimiter-based prompt - indented example JSON costs tokens
+            prompt = f"""FROM: {sender}
+SUBJ: {subject}
+BODY:
+{body}"""
 
             response = self.client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": "You are an expert email classifier. Always respond with valid JSON."},
+                    {"role": "system", "content": self._llm_system_prompt},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=200,
@@ -233,19 +240,20 @@ Rules:
             response_text = response_text.strip()
             
             try:
-                labels = json.loads(response_text)
+                labels = parse_json(response_text)
                 if isinstance(labels, list):
                     # Add source
                     for label in labels:
                         label["source"] = "llm"
                     return labels
             except json.JSONDecodeError:
-                print(f"Invalid JSON from LLM: {response_text}")
+                logger.warning("Invalid JSON from LLM")
+                logger.debug("LLM response: %s", response_text)
                 
             return []
             
         except Exception as e:
-            print(f"LLM classification failed: {e}")
+            logger.warning("LLM classification failed: %s", e)
             return []
     
     def _adjust_for_sender(self, base_confidence: float, label: str, sender: str) -> float:
@@ -334,7 +342,7 @@ Rules:
             conn.close()
             
         except Exception as e:
-            print(f"Error storing labels: {e}")
+            logger.warning("Error storing labels: %s", e)
     
     def get_email_labels(self, email_id: str) -> List[Dict]:
         """Get stored labels for an email"""
@@ -360,7 +368,7 @@ Rules:
             return labels
             
         except Exception as e:
-            print(f"Error getting labels: {e}")
+            logger.warning("Error getting labels: %s", e)
             return []
     
     def get_emails_by_label(self, label: str, limit: int = 50) -> List[str]:
@@ -380,7 +388,7 @@ Rules:
             return email_ids
             
         except Exception as e:
-            print(f"Error getting emails by label: {e}")
+            logger.warning("Error getting emails by label: %s", e)
             return []
     
     def get_label_statistics(self) -> Dict:
@@ -416,20 +424,18 @@ Rules:
             }
             
         except Exception as e:
-            print(f"Error getting label statistics: {e}")
+            logger.warning("Error getting label statistics: %s", e)
             return {}
 
-    def batch_classify_emails(self, emails: List[Dict]) -> Dict[str, List[Dict]]:
-        """Classify multiple emails efficiently"""
-        results = {}
-        
-        for email in emails:
-            email_id = email.get('id')
-            if email_id:
-                labels = self.classify_email(email)
-                results[email_id] = labels
+    def batch_classify_emails(self, emails: List[Dict], max_workers: int = 4) -> Dict[str, List[Dict]]:
+        """Classify multiple emails efficiently (LLM calls fanned out across threads)"""
+        emails = [email for email in emails if email.get('id')]
+        if not emails:
+            return {}
         
-        return results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(emails))) as executor:
+            labels = executor.map(self.classify_email, emails)
+            return {email['id']: email_labels for email, email_labels in zip(emails, labels)}
     
     def suggest_custom_labels(self, emails: List[Dict]) -> List[str]:
         """Suggest custom labels based on email patterns"""
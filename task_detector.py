@@ -5,17 +5,25 @@ Part of MailMaestro-level intelligence layer
 """
 
 import json
+import logging
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from openai import OpenAI
+from llm_client import get_openai_client, parse_json
 from config import config
 
+logger = logging.getLogger(__name__)
+
+# Fixed extraction instructions - sent as the system message so the email is the only varying part
+TASK_SYSTEM_PROMPT = """You are an expert at extracting actionable tasks from emails. Always respond with valid JSON.
+Extract action items from the email. Reply with ONLY a JSON array (no markdown).
+Item: {"task":str,"due_date":"YYYY-MM-DD"|relative|"none","owner":"me"|"sender"|"team","priority":"low"|"medium"|"high"|"urgent","confidence":0-1}
+Rules: actionable work only; task <= 12 words; no extra keys or commentary; [] if none."""
+
 class TaskDetector:
     """Extract and structure tasks from email content"""
     
     def __init__(self, model_router=None):
-        self.client = OpenAI()
         self.model_router = model_router
         
         # Task patterns for fast detection
@@ -37,6 +45,11 @@ class TaskDetector:
             r"(?:tomorrow|today|asap|urgent)"
         ]
     
+    @property
+    def client(self):
+        """Shared OpenAI client, resolved on each access to follow key changes"""
+        return get_openai_client()
+    
     def extract_tasks(self, email_text: str, email_metadata: Dict = None) -> List[Dict]:
         """
         Extract structured tasks from email content
@@ -62,7 +75,7 @@ class TaskDetector:
             return all_tasks
             
         except Exception as e:
-            print(f"Error extracting tasks: {e}")
+            logger.warning("Error extracting tasks: %s", e)
             return []
     
     def _extract_pattern_tasks(self, email_text: str) -> List[Dict]:
@@ -104,39 +117,19 @@ class TaskDetector:
             sender = email_metadata.get('sender', 'Unknown') if email_metadata else 'Unknown'
             subject = email_metadata.get('subject', '') if email_metadata else ''
             
-            prompt = f"""Extract action items/tasks from this email. Return ONLY valid JSON array.
-
-Email from: {sender}
-Subject: {subject}
-
-Email content:
-{email_text[:2000]}
-
-Extract tasks in this exact format:
-[
-  {{
-    "task": "specific action to take",
-    "due_date": "YYYY-MM-DD or relative like 'this friday'",
-    "owner": "me" or "sender" or "team",
-    "priority": "low" or "medium" or "high" or "urgent",
-    "confidence": 0.8
-  }}
-]
-
-Rules:
-- Only include actionable items requiring work
-- Be specific about what needs to be done
-- If no clear due date, use "none"
-- Return empty array [] if no tasks found
-- Must be valid JSON"""
+            # Compact, delimiter-based prompt - indented example JSON costs tokens
+            prompt = f"""FROM: {sender}
+SUBJ: {subject}
+BODY:
+{email_text[:2000]}"""
 
             response = self.client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": "You are an expert at extracting actionable tasks from emails. Always respond with valid JSON."},
+                    {"role": "system", "content": TASK_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=500,
+                max_tokens=250,
                 temperature=0.1
             )
             
@@ -153,7 +146,7 @@ Rules:
             
             # Parse JSON response
             try:
-                tasks = json.loads(response_text)
+                tasks = parse_json(response_text)
                 if isinstance(tasks, list):
                     # Add source and normalize
                     for task in tasks:
@@ -161,12 +154,13 @@ Rules:
                         task["confidence"] = task.get("confidence", 0.8)
                     return tasks
             except json.JSONDecodeError:
-                print(f"Invalid JSON from LLM: {response_text}")
+                logger.warning("Invalid JSON from LLM")
+                logger.debug("LLM response: %s", response_text)
             
             return []
             
         except Exception as e:
-            print(f"LLM task extraction failed: {e}")
+            logger.warning("LLM task extraction failed: %s", e)
             return []
     
     def _extract_date_from_text(self, text: str) -> str:
@@ -5,14 +5,19 @@ Part of MailMaestro-level intelligence layer
 """
 
 import os
+import re
 import json
+import logging
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional
-from openai import OpenAI
+from llm_client import get_openai_client
+from cachetools import TTLCache
 from config import config
 import sqlite3
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file if it exists
 try:
     from dotenv import load_dotenv
@@ -20,14 +25,43 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, that's okay
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Static instructions go in the system message so every call shares an
+# identical prompt prefix (provider-side prompt caching); the thread and its
+# length budget go last, in the user message
+SUMMARY_SYSTEM_PROMPT = """You are an expert email summarizer. Generate concise, actionable thread summaries.
+Summarize the email thread in exactly 2-3 lines.
+Focus on the main topic and current status/ask.
+
+Format:
+Line 1: Main topic/subject
+Line 2: Current status or outstanding ask
+Line 3: (optional) Next action if clear
+
+Keep it concise and actionable."""
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Truncate text to at most max_bytes of UTF-8 without splitting a character"""
+    encoded = text.encode('utf-8')
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode('utf-8', errors='ignore')
+
 class ThreadSummarizer:
     """Generate and cache thread summaries with LLM intelligence"""
     
     def __init__(self, model_router=None):
-        self.client = OpenAI()
         self.model_router = model_router
         self.cache_db = "secure_emails.db"
+        # In-memory layer in front of SQLite so repeat polls skip the DB
+        self.memory_cache = TTLCache(maxsize=256, ttl=300)
         
+    @property
+    def client(self):
+        """Current shared OpenAI client (rebuilt by llm_client if the key changed)"""
+        return get_openai_client()
+    
     def summarize_thread(self, thread_id: str, emails: List[Dict], 
                         max_chars: int = 300) -> str:
         """
@@ -42,9 +76,15 @@ class ThreadSummarizer:
             String summary (2-3 lines, ≤300 chars)
         """
         try:
-            # Check cache first
+            memory_key = (thread_id, self._hash_thread_content(emails))
+            cached = self.memory_cache.get(memory_key)
+            if cached:
+                return cached
+            
+            # Check persistent cache next
             cached = self._get_cached_summary(thread_id, emails)
             if cached:
+                self.memory_cache[memory_key] = cached
                 return cached
                 
             # Generate new summary
@@ -52,11 +92,12 @@ class ThreadSummarizer:
             
             # Cache the result
             self._cache_summary(thread_id, emails, summary)
+            self.memory_cache[memory_key] = summary
             
             return summary
             
         except Exception as e:
-            print(f"Error summarizing thread: {e}")
+            logger.warning("Error summarizing thread: %s", e)
             return self._fallback_summary(emails)
     
     def _generate_summary(self, emails: List[Dict], max_chars: int) -> str:
@@ -74,23 +115,15 @@ class ThreadSummarizer:
                 model = self.model_router.choose_model("summarize")
             
             # Create prompt
-            prompt = f"""Summarize this email thread in exactly 2-3 lines (max {max_chars} chars).
-Focus on the main topic and current status/ask.
-
-Thread context:
+            prompt = f"""Thread context:
 {context}
 
-Format:
-Line 1: Main topic/subject
-Line 2: Current status or outstanding ask
-Line 3: (optional) Next action if clear
-
-Keep it concise and actionable."""
+Max length: {max_chars} chars"""
 
             response = self.client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": "You are an expert email summarizer. Generate concise, actionable thread summaries."},
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=100,
@@ -109,17 +142,28 @@ Keep it concise and actionable."""
             return summary
             
         except Exception as e:
-            print(f"LLM summarization failed: {e}")
+            logger.warning("LLM summarization failed: %s", e)
             return self._fallback_summary(emails)
     
-    def _build_thread_context(self, emails: List[Dict]) -> str:
+    def _build_thread_context(self, emails: List[Dict], per_email_bytes: int = 600,
+                              total_bytes: int = 1500) -> str:
         """Build context string from email thread"""
-        context_parts = []
+        recent = emails[-3:]  # Last 3 emails
+        
+        # Collapse whitespace, then cap on UTF-8 bytes (closer to token cost than chars).
+        # The newest email gets first claim on the shared budget; older ones shrink first.
+        bodies = [''] * len(recent)
+        remaining = total_bytes
+        for idx in range(len(recent) - 1, -1, -1):
+            body = _WHITESPACE_RE.sub(' ', recent[idx].get('body', '')).strip()
+            body = _truncate_utf8(body, min(per_email_bytes, remaining))
+            bodies[idx] = body
+            remaining -= len(body.encode('utf-8'))
         
-        for i, email in enumerate(emails[-3:]):  # Last 3 emails
+        context_parts = []
+        for i, (email, body) in enumerate(zip(recent, bodies)):
             sender = email.get('sender', 'Unknown')
             subject = email.get('subject', 'No subject')
-            body = email.get('body', '')[:500]  # First 500 chars
             
             context_parts.append(f"Email {i+1} from {sender}:")
             context_parts.append(f"Subject: {subject}")
@@ -205,14 +249,15 @@ Keep it concise and actionable."""
             conn.close()
             
         except Exception as e:
-            print(f"Failed to cache summary: {e}")
+            logger.warning("Failed to cache summary: %s", e)
     
     def _hash_thread_content(self, emails: List[Dict]) -> str:
         """Generate hash of thread content for cache validation"""
-        content = ""
-        for email in emails:
-            content += email.get('id', '') + email.get('subject', '') + email.get('date', '')
-        return hashlib.md5(content.encode()).hexdigest()
+        content = "".join(
+            email.get('id', '') + email.get('subject', '') + email.get('date', '')
+            for email in emails
+        )
+        return hashlib.blake2b(content.encode('utf-8', 'ignore'), digest_size=8).hexdigest()
 
     def batch_summarize_threads(self, threads: Dict[str, List[Dict]]) -> Dict[str, str]:
         """Batch process multiple threads for efficiency"""
@@ -223,7 +268,7 @@ Keep it concise and actionable."""
                 summary = self.summarize_thread(thread_id, emails)
                 summaries[thread_id] = summary
             except Exception as e:
-                print(f"Failed to summarize thread {thread_id}: {e}")
+                logger.warning("Failed to summarize thread %s: %s", thread_id, e)
                 summaries[thread_id] = "Failed to summarize"
                 
         return summaries
\ No newline at end of file